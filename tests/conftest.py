@@ -39,16 +39,35 @@ except ImportError:
     messagebox.showerror = MagicMock()
     messagebox.showwarning = MagicMock()
 
-    # Mock validators
-    validators = MagicMock()
-    validators.url = MagicMock(return_value=True)
-
     # Inject mocks into sys.modules
     sys.modules['tkinter'] = tk
     sys.modules['tkinter.ttk'] = ttk
     sys.modules['tkinter.messagebox'] = messagebox
-    if 'validators' not in sys.modules:
-        sys.modules['validators'] = validators
+
+
+@pytest.fixture(autouse=True)
+def clear_ydl_cache() -> Generator[None, None, None]:
+    """Drop shared YoutubeDL instances and extracted info so patches don't leak between tests."""
+    from youtube_downloader.base_gui import _close_ydls, _info_cache
+
+    _close_ydls()
+    _info_cache.clear()
+    yield
+    _close_ydls()
+    _info_cache.clear()
+
+
+@pytest.fixture
+def fake_platform() -> Generator[Any, None, None]:
+    """Return a setter that makes Config detect the given platform name."""
+    from youtube_downloader import config as config_module
+
+    def set_platform(name: str) -> None:
+        with patch('platform.system', return_value=name):
+            config_module._refresh_platform()
+
+    yield set_platform
+    config_module._refresh_platform()
 
 
 @pytest.fixture
@@ -61,6 +80,8 @@ def mock_tk_root() -> MagicMock:
     root.configure = MagicMock()
     root.title = MagicMock()
     root.geometry = MagicMock()
+    root.protocol = MagicMock()
+    root.destroy = MagicMock()
     return root
 
 
@@ -197,22 +218,6 @@ def mock_threading() -> Generator[MagicMock, None, None]:
         yield mock_thread
 
 
-@pytest.fixture
-def mock_validators_valid() -> Generator[MagicMock, None, None]:
-    """Mock validators to always return True."""
-    with patch('youtube_downloader.base_gui.validators.url') as mock_val:
-        mock_val.return_value = True
-        yield mock_val
-
-
-@pytest.fixture
-def mock_validators_invalid() -> Generator[MagicMock, None, None]:
-    """Mock validators to always return False."""
-    with patch('youtube_downloader.base_gui.validators.url') as mock_val:
-        mock_val.return_value = False
-        yield mock_val
-
-
 @pytest.fixture
 def mock_path_exists_true() -> Generator[MagicMock, None, None]:
     """Mock Path.exists() to return True."""
@@ -13,7 +13,7 @@ class TestAudioDownloader:
     @pytest.fixture
     def audio_gui(self, mock_tk_root):
         """Create an audio downloader GUI instance for testing."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = Path("/tmp/test_music")
@@ -28,7 +28,7 @@ class TestAudioDownloader:
 
     def test_initialization(self, mock_tk_root):
         """Test audio downloader initialization."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = Path("/tmp/test_music")
@@ -45,12 +45,11 @@ class TestAudioDownloader:
         audio_gui.playlist_var.get.return_value = False
         audio_gui.download_btn = MagicMock()
 
-        with patch('youtube_downloader.audio_downloader.threading.Thread') as mock_thread:
+        with patch.object(YouTubeAudioDownloaderGUI, '_start_download') as mock_thread:
             audio_gui.download()
 
             mock_thread.assert_called_once()
-            call_args = mock_thread.call_args
-            assert call_args[1]['daemon'] is True
+            assert mock_thread.call_args[0][0] == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
             audio_gui.download_btn.config.assert_called_once_with(state='disabled')
 
     def test_download_audio_playlist(self, audio_gui):
@@ -58,13 +57,13 @@ class TestAudioDownloader:
         audio_gui.url_entry.get.return_value = "https://www.youtube.com/playlist?list=PLtest"
         audio_gui.playlist_var.get.return_value = True
 
-        with patch('youtube_downloader.audio_downloader.threading.Thread') as mock_thread:
+        with patch.object(YouTubeAudioDownloaderGUI, '_start_download') as mock_thread:
             audio_gui.download()
 
             assert mock_thread.called
             # Verify playlist mode is enabled
             call_args = mock_thread.call_args
-            args = call_args[1]['args']
+            args = call_args[0]
             ydl_opts = args[1]
             assert ydl_opts['noplaylist'] is False
 
@@ -73,11 +72,11 @@ class TestAudioDownloader:
         audio_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=test"
         audio_gui.playlist_var.get.return_value = False
 
-        with patch('youtube_downloader.audio_downloader.threading.Thread') as mock_thread:
+        with patch.object(YouTubeAudioDownloaderGUI, '_start_download') as mock_thread:
             audio_gui.download()
 
             call_args = mock_thread.call_args
-            args = call_args[1]['args']
+            args = call_args[0]
             ydl_opts = args[1]
 
             assert ydl_opts['format'] == 'bestaudio/best'
@@ -122,7 +121,7 @@ class TestAudioDownloader:
 
     def test_create_widgets(self, mock_tk_root):
         """Test widget creation."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk') as mock_ttk:
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = Path("/tmp/test")
@@ -155,7 +154,7 @@ class TestAudioDownloader:
         audio_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=test"
         audio_gui.playlist_var.get.return_value = False
 
-        with patch('youtube_downloader.audio_downloader.threading.Thread'):
+        with patch.object(YouTubeAudioDownloaderGUI, '_start_download'):
             audio_gui.download()
 
             audio_gui.download_btn.config.assert_called_once_with(state='disabled')
@@ -165,11 +164,11 @@ class TestAudioDownloader:
         audio_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=test"
         audio_gui.playlist_var.get.return_value = False
 
-        with patch('youtube_downloader.audio_downloader.threading.Thread') as mock_thread:
+        with patch.object(YouTubeAudioDownloaderGUI, '_start_download') as mock_thread:
             audio_gui.download()
 
             call_args = mock_thread.call_args
-            args = call_args[1]['args']
+            args = call_args[0]
             ydl_opts = args[1]
 
             assert 'progress_hooks' in ydl_opts
@@ -182,18 +181,18 @@ class TestAudioDownloader:
 
         # Test with playlist disabled
         audio_gui.playlist_var.get.return_value = False
-        with patch('youtube_downloader.audio_downloader.threading.Thread') as mock_thread:
+        with patch.object(YouTubeAudioDownloaderGUI, '_start_download') as mock_thread:
             audio_gui.download()
             call_args = mock_thread.call_args
-            ydl_opts = call_args[1]['args'][1]
+            ydl_opts = call_args[0][1]
             assert ydl_opts['noplaylist'] is True
 
         # Test with playlist enabled
         audio_gui.playlist_var.get.return_value = True
-        with patch('youtube_downloader.audio_downloader.threading.Thread') as mock_thread:
+        with patch.object(YouTubeAudioDownloaderGUI, '_start_download') as mock_thread:
             audio_gui.download()
             call_args = mock_thread.call_args
-            ydl_opts = call_args[1]['args'][1]
+            ydl_opts = call_args[0][1]
             assert ydl_opts['noplaylist'] is False
 
     def test_main_function(self):
@@ -213,21 +212,146 @@ class TestAudioDownloader:
         audio_gui.url_entry.get.return_value = "  https://www.youtube.com/watch?v=test  "
         audio_gui.playlist_var.get.return_value = False
 
-        with patch('youtube_downloader.audio_downloader.threading.Thread') as mock_thread:
+        with patch.object(YouTubeAudioDownloaderGUI, '_start_download') as mock_thread:
             audio_gui.download()
 
             call_args = mock_thread.call_args
-            url = call_args[1]['args'][0]
+            url = call_args[0][0]
             # Verify URL is stripped (checked in download_worker via validate_url)
             assert url == "  https://www.youtube.com/watch?v=test  "
 
-    def test_thread_daemon_mode(self, audio_gui):
-        """Test that download thread runs in daemon mode."""
+    def test_download_uses_shared_worker(self, audio_gui):
+        """Test that downloads are queued on the shared background loop."""
         audio_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=test"
         audio_gui.playlist_var.get.return_value = False
 
-        with patch('youtube_downloader.audio_downloader.threading.Thread') as mock_thread:
+        with patch.object(YouTubeAudioDownloaderGUI, '_start_download') as mock_start:
             audio_gui.download()
 
-            call_args = mock_thread.call_args
-            assert call_args[1]['daemon'] is True
+            mock_start.assert_called_once()
+            assert mock_start.call_args[0][0] == "https://www.youtube.com/watch?v=test"
+
+
+class TestAudioDownloaderBehaviour:
+    """Focused tests that don't need a real Tk root."""
+
+    @pytest.fixture
+    def bare_gui(self):
+        """Create an audio GUI without running __init__, with mocked widgets."""
+        gui = YouTubeAudioDownloaderGUI.__new__(YouTubeAudioDownloaderGUI)
+        gui.root = MagicMock()
+        gui.url_entry = MagicMock()
+        gui.download_btn = MagicMock()
+        gui.cancel_btn = MagicMock()
+        gui.format_var = MagicMock()
+        gui.format_var.get.return_value = "MP3"
+        gui.playlist_var = MagicMock()
+        gui.playlist_var.get.return_value = False
+        gui.progress_var = MagicMock()
+        gui.status_label = MagicMock()
+        gui.user_config = MagicMock()
+        gui._opts_cache = {}
+        gui._toast = MagicMock()
+        gui._toast_after = None
+        return gui
+
+    @pytest.mark.parametrize("codec,expected", [("mp3", "mp3"), (" M4A ", "m4a")])
+    def test_codec_accepted(self, bare_gui, codec, expected):
+        """Test that allowed codecs are normalized and accepted."""
+        assert bare_gui._validate_audio_codec(codec) == expected
+
+    @pytest.mark.parametrize("codec", ["mp3;rm", "ｍp3", "", "ogg"])
+    def test_codec_rejected(self, bare_gui, codec):
+        """Test that unknown or non-ASCII codecs raise ValueError."""
+        with pytest.raises(ValueError):
+            bare_gui._validate_audio_codec(codec)
+
+    def test_playlist_param_must_be_in_query(self, bare_gui):
+        """Test that list= is only recognized in the query string, not the fragment."""
+        bare_gui.playlist_var.get.return_value = True
+
+        bare_gui.validate_url("https://www.youtube.com/watch?v=abc&list=PLtest")
+        with pytest.raises(ValueError, match="playlist"):
+            bare_gui.validate_url("https://www.youtube.com/watch?v=abc#list=PLtest")
+
+    def test_download_options_cached_until_format_changes(self, bare_gui):
+        """Test that options are sanitized once per format and re-sanitized after a change."""
+        bare_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=abc"
+        sanitize = MagicMock(side_effect=lambda opts: opts)
+
+        with patch.object(bare_gui, '_sanitize_download_options', sanitize):
+            with patch.object(bare_gui, '_start_download') as mock_start:
+                bare_gui.download()
+                bare_gui.download()
+                assert sanitize.call_count == 1
+
+                first_opts = mock_start.call_args_list[0][0][1]
+                second_opts = mock_start.call_args_list[1][0][1]
+                assert first_opts == second_opts
+                assert first_opts is not second_opts
+
+                bare_gui.on_format_change()
+                bare_gui.download()
+                assert sanitize.call_count == 2
+
+    def test_show_error_inline_and_clears(self, bare_gui):
+        """Test that validation errors use the inline label and replace a pending clear."""
+        bare_gui.root.after.side_effect = ["after#1", "after#2"]
+
+        bare_gui._show_error("first")
+        bare_gui._show_error("second")
+
+        bare_gui.root.after_cancel.assert_called_once_with("after#1")
+        bare_gui._toast.config.assert_called_with(text="second")
+
+        bare_gui._clear_error()
+        bare_gui._toast.config.assert_called_with(text="")
+        assert bare_gui._toast_after is None
+
+    def test_validation_error_does_not_open_dialog(self, bare_gui):
+        """Test that an empty URL shows an inline error without a modal dialog."""
+        bare_gui.url_entry.get.return_value = "   "
+
+        with patch('youtube_downloader.base_gui.messagebox') as mock_mb:
+            bare_gui.download()
+
+        mock_mb.showerror.assert_not_called()
+        bare_gui._toast.config.assert_called_with(text="Please enter a URL")
+
+    def test_update_progress_does_not_force_repaint(self, bare_gui):
+        """Test that progress updates leave repainting to Tk's idle loop."""
+        bare_gui.update_progress(50.0, "Downloading: 50.0%")
+
+        bare_gui.progress_var.set.assert_called_once_with(50.0)
+        bare_gui.status_label.config.assert_called_once_with(text="Downloading: 50.0%")
+        bare_gui.root.update_idletasks.assert_not_called()
+
+    def test_postprocessor_args_allowlisted(self, bare_gui):
+        """Test that only -threads and integer values survive sanitizing."""
+        ydl_opts = {'postprocessor_args': ['-threads', '3', '-i', '/etc/passwd', '4k']}
+
+        sanitized = bare_gui._sanitize_download_options(ydl_opts)
+
+        assert sanitized['postprocessor_args'] == ['-threads', '3']
+
+    def test_default_output_dir_prefers_saved_dir(self, bare_gui):
+        """Test that the saved audio directory wins and the music dir is not looked up."""
+        bare_gui.config = MagicMock()
+        bare_gui.user_config.get_last_audio_dir.return_value = "/saved/audio"
+
+        assert bare_gui._default_output_dir() == Path("/saved/audio")
+        bare_gui.config.get_default_music_dir.assert_not_called()
+
+    def test_default_output_dir_falls_back_to_music_dir(self, bare_gui):
+        """Test that the platform music dir is used when nothing is saved."""
+        bare_gui.config = MagicMock()
+        bare_gui.config.get_default_music_dir.return_value = Path("/home/user/Music")
+        bare_gui.user_config.get_last_audio_dir.return_value = None
+
+        assert bare_gui._default_output_dir() == Path("/home/user/Music")
+
+    def test_format_names_match_formats(self):
+        """Test that the precomputed combobox values follow the format table."""
+        from youtube_downloader.constants import AUDIO_FORMATS, AUDIO_FORMAT_NAMES
+
+        assert AUDIO_FORMAT_NAMES == tuple(AUDIO_FORMATS)
@@ -1,5 +1,7 @@
 """Tests for base GUI module."""
 
+import json
+import os
 import pytest
 from unittest.mock import MagicMock, patch, Mock
 from pathlib import Path
@@ -102,7 +104,7 @@ class TestBaseGUI:
         ydl_opts = {'format': 'bestaudio'}
         gui.download_btn = MagicMock()
 
-        with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
+        with patch('yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
             with patch('youtube_downloader.base_gui.messagebox', mock_messagebox):
                 with patch('pathlib.Path.exists', return_value=True):
                     gui.download_worker(url, ydl_opts)
@@ -139,7 +141,7 @@ class TestBaseGUI:
         ydl_opts = {'format': 'bestaudio'}
         gui.download_btn = MagicMock()
 
-        with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL', return_value=mock_yt_dlp_error):
+        with patch('yt_dlp.YoutubeDL', return_value=mock_yt_dlp_error):
             with patch('youtube_downloader.base_gui.messagebox', mock_messagebox):
                 gui.download_worker(url, ydl_opts)
 
@@ -179,3 +181,189 @@ class TestBaseGUI:
         else:
             with pytest.raises(ValueError):
                 gui.validate_url(url)
+
+    @pytest.mark.parametrize("platform_name,cpus,expected", [
+        ('linux', {0, 1, 2, 3}, ['-threads', '3']),
+        ('linux', {0}, ['-threads', '1']),
+        ('win32', {0, 1, 2, 3}, []),
+    ])
+    def test_ffmpeg_thread_args(self, platform_name, cpus, expected):
+        """Test that the ffmpeg thread limit leaves out the CPU the worker gives up."""
+        from youtube_downloader.base_gui import _ffmpeg_thread_args
+
+        with patch('youtube_downloader.base_gui.sys.platform', platform_name):
+            with patch('os.sched_getaffinity', return_value=cpus, create=True):
+                assert _ffmpeg_thread_args() == expected
+
+    def test_sanitize_output_dir_follows_symlinked_parent(self, gui, tmp_path):
+        """Test that a symlink inside an allowed root can't redirect downloads outside it."""
+        if not Path("/etc").is_dir():
+            pytest.skip("needs a directory outside the allowed roots")
+        link = tmp_path / "link_outside"
+        try:
+            link.symlink_to(Path("/etc"), target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        result = gui._sanitize_output_dir(link / "sub")
+
+        assert result == (Path.home() / "Downloads").resolve()
+
+    def test_post_ui_coalesces_updates(self):
+        """Test that queued UI updates share one scheduled drain."""
+        import queue
+        import threading
+
+        gui = BaseYouTubeDownloaderGUI.__new__(BaseYouTubeDownloaderGUI)
+        gui.root = MagicMock()
+        gui._ui_queue = queue.SimpleQueue()
+        gui._ui_lock = threading.Lock()
+        gui._ui_drain_pending = False
+        calls = []
+
+        gui._post_ui(calls.append, 1)
+        gui._post_ui(calls.append, 2)
+        assert gui.root.after.call_count == 1
+
+        gui.root.after.call_args[0][1]()
+        assert calls == [1, 2]
+
+        gui._post_ui(calls.append, 3)
+        assert gui.root.after.call_count == 2
+
+    def test_extracted_info_shared_across_url_variants(self):
+        """Test that video info is extracted once per video id and handed out as copies."""
+        from youtube_downloader.base_gui import _extract_info_cached
+
+        ydl = MagicMock()
+        ydl.extract_info.return_value = {'id': 'abc', 'formats': []}
+
+        first = _extract_info_cached(ydl, "https://www.youtube.com/watch?v=abc&t=10s")
+        first['formats'].append('mutated')
+        second = _extract_info_cached(ydl, "https://youtu.be/abc")
+
+        assert ydl.extract_info.call_count == 1
+        assert second == {'id': 'abc', 'formats': []}
+
+    def test_shared_ydl_gets_hooks_per_download(self, gui):
+        """Test that hooks reach the cached instance through its relay and are cleared after."""
+        from youtube_downloader import base_gui
+
+        hook = MagicMock()
+        ydl_opts = {'format': 'best', 'progress_hooks': [hook]}
+        with patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+            ydl = mock_ydl_class.return_value
+            ydl.download.side_effect = lambda urls: relay({'status': 'downloading'})
+            gui.validate_url = MagicMock()
+            gui._check_disk_space = MagicMock(return_value=True)
+            gui._validate_ffmpeg_path = MagicMock()
+            relay = None
+
+            def build(opts):
+                nonlocal relay
+                (relay,) = opts['progress_hooks']
+                return ydl
+            mock_ydl_class.side_effect = build
+
+            gui.download_worker("https://www.youtube.com/watch?v=test", ydl_opts)
+
+            hook.assert_called_once_with({'status': 'downloading'})
+            assert list(base_gui._ydl_cache.values()) == [(ydl, relay)]
+            assert relay.hooks == []
+
+    def test_checked_out_ydl_is_not_shared(self):
+        """Test that an instance in use is out of the cache and reused once returned."""
+        from youtube_downloader import base_gui
+
+        key = base_gui._freeze({'format': 'best'})
+        with patch('yt_dlp.YoutubeDL', side_effect=lambda opts: MagicMock()):
+            first = base_gui._checkout_ydl(key)
+            second = base_gui._checkout_ydl(key)
+            assert first[0] is not second[0]
+
+            base_gui._checkin_ydl(key, first)
+            assert base_gui._checkout_ydl(key) is first
+
+    def test_ydl_without_run_state_is_rebuilt(self):
+        """Test that an instance whose private counters are gone is closed, not reused."""
+        from youtube_downloader import base_gui
+
+        key = base_gui._freeze({'format': 'best'})
+        stale = MagicMock(spec=['close'])
+        base_gui._checkin_ydl(key, (stale, base_gui._HookRelay()))
+        with patch('yt_dlp.YoutubeDL', side_effect=lambda opts: MagicMock()):
+            ydl, _ = base_gui._checkout_ydl(key)
+
+        assert ydl is not stale
+        stale.close.assert_called_once()
+
+    def test_evicted_ydl_is_closed(self):
+        """Test that the least recently used YoutubeDL is closed on eviction."""
+        from youtube_downloader import base_gui
+
+        keys = [base_gui._freeze({'n': i}) for i in range(base_gui._YDL_CACHE_SIZE + 1)]
+        with patch('yt_dlp.YoutubeDL', side_effect=lambda opts: MagicMock()):
+            entries = [base_gui._checkout_ydl(key) for key in keys]
+        for key, entry in zip(keys, entries):
+            base_gui._checkin_ydl(key, entry)
+
+        entries[0][0].close.assert_called_once()
+        assert keys[0] not in base_gui._ydl_cache
+
+    @pytest.mark.parametrize("reuse_info", [False, True])
+    def test_failed_retcode_raises(self, reuse_info):
+        """Test that a non-zero yt-dlp retcode fails the download on both paths."""
+        gui = BaseYouTubeDownloaderGUI.__new__(BaseYouTubeDownloaderGUI)
+        gui._reuse_info = reuse_info
+        ydl = MagicMock()
+        ydl.download.return_value = 1
+        ydl.download_with_info_file.return_value = 1
+        ydl.extract_info.return_value = {'id': 'abc'}
+        ydl.sanitize_info.side_effect = lambda info: info
+
+        with pytest.raises(RuntimeError, match="exit code 1"):
+            gui._run_download(ydl, "https://www.youtube.com/watch?v=abc")
+
+    def test_reused_info_goes_through_info_file(self):
+        """Test that cached info is handed to download_with_info_file and the file removed."""
+        from youtube_downloader.base_gui import _download_with_info
+
+        seen = {}
+
+        def download_with_info_file(path):
+            seen['path'] = path
+            with open(path, encoding='utf-8') as f:
+                seen['info'] = json.load(f)
+            return 0
+
+        ydl = MagicMock()
+        ydl.sanitize_info.side_effect = lambda info: info
+        ydl.download_with_info_file.side_effect = download_with_info_file
+
+        assert _download_with_info(ydl, {'id': 'abc'}) == 0
+        assert seen['info'] == {'id': 'abc'}
+        assert not os.path.exists(seen['path'])
+
+    def test_window_close_flushes_user_config(self, gui, mock_tk_root):
+        """Test that closing the window writes pending preferences before destroying it."""
+        mock_tk_root.protocol.assert_called_with("WM_DELETE_WINDOW", gui._on_close)
+        gui.user_config = MagicMock()
+
+        gui._on_close()
+
+        gui.user_config.close.assert_called_once()
+        mock_tk_root.destroy.assert_called_once()
+
+    def test_configure_logging_runs_once(self):
+        """Test that console and file handlers are attached only on the first call."""
+        from youtube_downloader import base_gui
+
+        with patch.object(base_gui, '_log_configured', False):
+            with patch('youtube_downloader.base_gui.logging') as mock_logging:
+                with patch('pathlib.Path.mkdir'):
+                    base_gui.configure_logging()
+                    base_gui.configure_logging()
+
+                    mock_logging.StreamHandler.assert_called_once()
+                    mock_logging.FileHandler.assert_called_once()
+                    assert mock_logging.getLogger.return_value.addHandler.call_count == 2
@@ -1,5 +1,7 @@
 """Tests for configuration module."""
 
+import os
+import tempfile
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -32,46 +34,46 @@ class TestConfig:
         ("Darwin", Path.home() / "Music"),
         ("Linux", Path.home() / "Music"),
     ])
-    def test_music_dir_by_platform(self, platform_name, expected_music_dir):
+    def test_music_dir_by_platform(self, platform_name, expected_music_dir, fake_platform):
         """Test music directory path for different platforms."""
-        with patch('platform.system', return_value=platform_name):
-            config = Config()
-            music_dir = config.get_default_music_dir()
-            assert music_dir == expected_music_dir
+        fake_platform(platform_name)
+        config = Config()
+        music_dir = config.get_default_music_dir()
+        assert music_dir == expected_music_dir
 
     @pytest.mark.parametrize("platform_name,expected_video_dir", [
         ("Windows", Path.home() / "Videos"),
         ("Darwin", Path.home() / "Movies"),
         ("Linux", Path.home() / "Videos"),
     ])
-    def test_video_dir_by_platform(self, platform_name, expected_video_dir):
+    def test_video_dir_by_platform(self, platform_name, expected_video_dir, fake_platform):
         """Test video directory path for different platforms."""
-        with patch('platform.system', return_value=platform_name):
-            config = Config()
-            video_dir = config.get_default_video_dir()
-            assert video_dir == expected_video_dir
+        fake_platform(platform_name)
+        config = Config()
+        video_dir = config.get_default_video_dir()
+        assert video_dir == expected_video_dir
 
-    def test_ffmpeg_path_windows(self):
+    def test_ffmpeg_path_windows(self, fake_platform):
         """Test FFmpeg path on Windows."""
-        with patch('platform.system', return_value='Windows'):
-            config = Config()
-            ffmpeg_path = config.get_ffmpeg_path()
-            assert ffmpeg_path.endswith('ffmpeg.exe')
-            assert './ffmpeg' in ffmpeg_path
+        fake_platform('Windows')
+        config = Config()
+        ffmpeg_path = config.get_ffmpeg_path()
+        assert ffmpeg_path.endswith('ffmpeg.exe')
+        assert './ffmpeg' in ffmpeg_path
 
-    def test_ffmpeg_path_unix(self):
+    def test_ffmpeg_path_unix(self, fake_platform):
         """Test FFmpeg path on Unix-like systems."""
-        with patch('platform.system', return_value='Linux'):
-            config = Config()
-            ffmpeg_path = config.get_ffmpeg_path()
-            assert ffmpeg_path == 'ffmpeg'
+        fake_platform('Linux')
+        config = Config()
+        ffmpeg_path = config.get_ffmpeg_path()
+        assert ffmpeg_path == 'ffmpeg'
 
-    def test_ffmpeg_path_macos(self):
+    def test_ffmpeg_path_macos(self, fake_platform):
         """Test FFmpeg path on macOS."""
-        with patch('platform.system', return_value='Darwin'):
-            config = Config()
-            ffmpeg_path = config.get_ffmpeg_path()
-            assert ffmpeg_path == 'ffmpeg'
+        fake_platform('Darwin')
+        config = Config()
+        ffmpeg_path = config.get_ffmpeg_path()
+        assert ffmpeg_path == 'ffmpeg'
 
     def test_platform_detection(self):
         """Test that platform is correctly detected."""
@@ -106,3 +108,110 @@ class TestConfig:
         assert config1.get_default_music_dir() == config2.get_default_music_dir()
         assert config1.get_default_video_dir() == config2.get_default_video_dir()
         assert config1.get_ffmpeg_path() == config2.get_ffmpeg_path()
+
+    def test_ffmpeg_lookup_is_cached(self, tmp_path):
+        """Test that the FFmpeg search and successful validation run once."""
+        ffmpeg = tmp_path / "ffmpeg"
+        ffmpeg.write_text("")
+        config = Config()
+        config.invalidate_ffmpeg_cache()
+        with patch.object(config, '_check_ffmpeg_executable', return_value=str(ffmpeg)) as check:
+            first = config.get_ffmpeg_path()
+            assert config.get_ffmpeg_path() == first
+            assert config.validate_ffmpeg_executable('ffmpeg') == str(ffmpeg)
+        assert check.call_count == 1
+        config.invalidate_ffmpeg_cache()
+
+    def test_ffmpeg_not_found_is_not_cached(self):
+        """Test that a failed search is retried, so FFmpeg installed later is found."""
+        config = Config()
+        config.invalidate_ffmpeg_cache()
+        with patch.object(Config, '_find_ffmpeg_path', return_value=None) as find:
+            config.get_ffmpeg_path()
+            config.get_ffmpeg_path()
+        assert find.call_count == 2
+
+    def test_ffmpeg_revalidated_after_change(self, tmp_path):
+        """Test that a cached validation is redone once the file changes."""
+        ffmpeg = tmp_path / "ffmpeg"
+        ffmpeg.write_text("")
+        config = Config()
+        config.invalidate_ffmpeg_cache()
+        with patch.object(config, '_check_ffmpeg_executable', return_value=str(ffmpeg)) as check:
+            config.validate_ffmpeg_executable(str(ffmpeg))
+            config.validate_ffmpeg_executable(str(ffmpeg))
+            assert check.call_count == 1
+
+            ffmpeg.chmod(0o600)
+            config.validate_ffmpeg_executable(str(ffmpeg))
+            assert check.call_count == 2
+        config.invalidate_ffmpeg_cache()
+
+    def test_ffmpeg_cache_shared_between_instances(self, tmp_path):
+        """Test that a second Config reuses the first one's FFmpeg lookup."""
+        ffmpeg = tmp_path / "ffmpeg"
+        ffmpeg.write_text("")
+        ffmpeg.chmod(0o755)
+        Config().invalidate_ffmpeg_cache()
+        first = Config()
+        with patch.object(Config, '_find_ffmpeg_path', return_value=str(ffmpeg)) as find:
+            assert first.get_ffmpeg_path() == Config().get_ffmpeg_path()
+        assert find.call_count == 1
+        first.invalidate_ffmpeg_cache()
+
+    def test_removed_ffmpeg_is_searched_again(self, tmp_path):
+        """Test that a cached FFmpeg path that no longer exists triggers a new search."""
+        ffmpeg = tmp_path / "ffmpeg"
+        ffmpeg.write_text("")
+        ffmpeg.chmod(0o755)
+        config = Config()
+        config.invalidate_ffmpeg_cache()
+        with patch.object(Config, '_find_ffmpeg_path', side_effect=[str(ffmpeg), None]) as find:
+            assert config.get_ffmpeg_path() == str(ffmpeg)
+            ffmpeg.unlink()
+            assert config.get_ffmpeg_path() != str(ffmpeg)
+        assert find.call_count == 2
+        config.invalidate_ffmpeg_cache()
+
+    def test_default_dir_is_memoized(self):
+        """Test that a validated default directory is reused until invalidated."""
+        config = Config()
+        first = config.get_default_music_dir()
+        with patch.object(config, '_validate_directory') as validate:
+            assert config.get_default_music_dir() == first
+            validate.assert_not_called()
+            config.invalidate_dir_cache()
+            config.get_default_music_dir()
+            validate.assert_called()
+
+    def test_fallback_dirs_keep_priority(self, tmp_path):
+        """Test that a missing earlier fallback is created before a later existing one is used."""
+        config = Config()
+        first, second = tmp_path / "first", tmp_path / "second"
+        second.mkdir()
+        config._primary_dirs["music"] = tmp_path / "file"
+        (tmp_path / "file").write_text("")
+        config._fallback_dirs["music"] = (first, second)
+
+        assert config._find_default_dir("music") == first.resolve()
+        assert first.is_dir()
+
+    def test_trusted_dir_skips_location_check(self):
+        """Test that only untrusted paths are held to the allowed locations."""
+        config = Config()
+        config._allowed_root_prefixes = ("/nonexistent-root" + os.sep,)
+        assert config._validate_directory(Path(tempfile.gettempdir())) is None
+        assert config._validate_directory(Path(tempfile.gettempdir()), trusted=True) is not None
+
+    def test_fallback_dirs_keep_location_check(self, tmp_path):
+        """Test that only the built-in primary dir skips the allowed-location check."""
+        config = Config()
+        config._allowed_root_prefixes = ("/nonexistent-root" + os.sep,)
+        config._primary_dirs = {"music": tmp_path / "primary"}
+        config._fallback_dirs = {"music": (tmp_path / "fallback",)}
+        assert config._find_default_dir("music") == (tmp_path / "primary").resolve()
+
+        (tmp_path / "primary").rmdir()
+        (tmp_path / "primary").write_text("")
+        assert config._find_default_dir("music") is None
+        assert not (tmp_path / "fallback").exists()
@@ -74,7 +74,7 @@ class TestDownloadErrors:
     @pytest.fixture
     def audio_gui(self, mock_tk_root, temp_dir):
         """Create audio GUI for error testing."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = temp_dir
@@ -92,8 +92,8 @@ class TestDownloadErrors:
         url = "https://www.youtube.com/watch?v=test"
         audio_gui.download_btn = MagicMock()
 
-        with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL') as mock_ydl:
-            mock_ydl.return_value.__enter__.return_value.download.side_effect = \
+        with patch('yt_dlp.YoutubeDL') as mock_ydl:
+            mock_ydl.return_value.download.side_effect = \
                 RuntimeError("Unable to download: Network error")
 
             with patch('youtube_downloader.base_gui.messagebox', mock_messagebox):
@@ -110,8 +110,8 @@ class TestDownloadErrors:
         url = "https://www.youtube.com/watch?v=test"
         audio_gui.download_btn = MagicMock()
 
-        with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL') as mock_ydl:
-            mock_ydl.return_value.__enter__.return_value.download.side_effect = \
+        with patch('yt_dlp.YoutubeDL') as mock_ydl:
+            mock_ydl.return_value.download.side_effect = \
                 RuntimeError("Video unavailable")
 
             with patch('youtube_downloader.base_gui.messagebox', mock_messagebox):
@@ -140,8 +140,8 @@ class TestDownloadErrors:
         url = "https://www.youtube.com/watch?v=test"
         audio_gui.download_btn = MagicMock()
 
-        with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL') as mock_ydl:
-            mock_ydl.return_value.__enter__.return_value.download.side_effect = \
+        with patch('yt_dlp.YoutubeDL') as mock_ydl:
+            mock_ydl.return_value.download.side_effect = \
                 OSError("No space left on device")
 
             with patch('youtube_downloader.base_gui.messagebox', mock_messagebox):
@@ -156,8 +156,8 @@ class TestDownloadErrors:
         url = "https://www.youtube.com/watch?v=test"
         audio_gui.download_btn = MagicMock()
 
-        with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL') as mock_ydl:
-            mock_ydl.return_value.__enter__.return_value.download.side_effect = \
+        with patch('yt_dlp.YoutubeDL') as mock_ydl:
+            mock_ydl.return_value.download.side_effect = \
                 PermissionError("Permission denied")
 
             with patch('youtube_downloader.base_gui.messagebox', mock_messagebox):
@@ -174,7 +174,7 @@ class TestPlaylistErrors:
     @pytest.fixture
     def audio_gui(self, mock_tk_root, temp_dir):
         """Create audio GUI for playlist testing."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = temp_dir
@@ -247,9 +247,9 @@ class TestProgressUpdateErrors:
     @pytest.fixture
     def video_gui(self, mock_tk_root, temp_dir):
         """Create video GUI for progress testing."""
-        with patch('youtube_downloader.video_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
-                with patch('youtube_downloader.video_downloader.logging'):
+                with patch('youtube_downloader.video_downloader.logger'):
                     mock_config = MagicMock()
                     mock_config.get_default_video_dir.return_value = temp_dir
                     mock_config_class.return_value = mock_config
@@ -269,11 +269,11 @@ class TestProgressUpdateErrors:
             'downloaded_bytes': 'invalid',  # Should be int
         }
 
-        with patch('youtube_downloader.video_downloader.logging') as mock_logging:
+        with patch('youtube_downloader.video_downloader.logger') as mock_logger:
             # Should not crash
             video_gui.download_hook(progress_data)
             # Should log error
-            assert mock_logging.error.called
+            assert mock_logger.error.called
 
     def test_progress_with_missing_fields(self, video_gui):
         """Test progress hook with missing fields."""
@@ -282,7 +282,7 @@ class TestProgressUpdateErrors:
             # Missing total_bytes and downloaded_bytes
         }
 
-        with patch('youtube_downloader.video_downloader.logging'):
+        with patch('youtube_downloader.video_downloader.logger'):
             # Should not crash
             video_gui.download_hook(progress_data)
 
@@ -294,7 +294,7 @@ class TestProgressUpdateErrors:
             'downloaded_bytes': 1000,
         }
 
-        with patch('youtube_downloader.video_downloader.logging'):
+        with patch('youtube_downloader.video_downloader.logger'):
             # Should not crash (division by zero)
             video_gui.download_hook(progress_data)
 
@@ -306,7 +306,7 @@ class TestProgressUpdateErrors:
             'downloaded_bytes': -500,
         }
 
-        with patch('youtube_downloader.video_downloader.logging'):
+        with patch('youtube_downloader.video_downloader.logger'):
             # Should not crash
             video_gui.download_hook(progress_data)
 
@@ -316,7 +316,7 @@ class TestProgressUpdateErrors:
             'status': 'unknown_status',
         }
 
-        with patch('youtube_downloader.video_downloader.logging'):
+        with patch('youtube_downloader.video_downloader.logger'):
             # Should not crash
             video_gui.download_hook(progress_data)
 
@@ -362,7 +362,7 @@ class TestEdgeCases:
 
     def test_concurrent_downloads_attempt(self, mock_tk_root, temp_dir):
         """Test attempting multiple downloads simultaneously."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = temp_dir
@@ -377,7 +377,7 @@ class TestEdgeCases:
                 gui.playlist_var.get.return_value = False
 
                 # First download
-                with patch('youtube_downloader.audio_downloader.threading.Thread'):
+                with patch.object(YouTubeAudioDownloaderGUI, '_start_download'):
                     gui.download()
                     first_call = gui.download_btn.config.call_args_list[0]
 
@@ -405,21 +405,21 @@ class TestEdgeCases:
             assert gui.output_dir == output_dir
 
     @pytest.mark.parametrize("platform_name", ["Windows", "Darwin", "Linux", "FreeBSD"])
-    def test_config_on_different_platforms(self, platform_name):
+    def test_config_on_different_platforms(self, platform_name, fake_platform):
         """Test config behavior on different platforms."""
-        with patch('platform.system', return_value=platform_name):
-            config = Config()
-            music_dir = config.get_default_music_dir()
-            video_dir = config.get_default_video_dir()
-            ffmpeg_path = config.get_ffmpeg_path()
+        fake_platform(platform_name)
+        config = Config()
+        music_dir = config.get_default_music_dir()
+        video_dir = config.get_default_video_dir()
+        ffmpeg_path = config.get_ffmpeg_path()
 
-            assert isinstance(music_dir, Path)
-            assert isinstance(video_dir, Path)
-            assert isinstance(ffmpeg_path, str)
+        assert isinstance(music_dir, Path)
+        assert isinstance(video_dir, Path)
+        assert isinstance(ffmpeg_path, str)
 
     def test_empty_url_entry(self, mock_tk_root, temp_dir):
         """Test download with empty URL entry."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = temp_dir
@@ -441,7 +441,7 @@ class TestEdgeCases:
 
     def test_whitespace_only_url(self, mock_tk_root, temp_dir):
         """Test download with whitespace-only URL."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = temp_dir
@@ -465,7 +465,7 @@ class TestButtonStateManagement:
     @pytest.fixture
     def audio_gui(self, mock_tk_root, temp_dir):
         """Create audio GUI for button state testing."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = temp_dir
@@ -482,8 +482,8 @@ class TestButtonStateManagement:
         """Test that button is re-enabled after download error."""
         url = "https://www.youtube.com/watch?v=test"
 
-        with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL') as mock_ydl:
-            mock_ydl.return_value.__enter__.return_value.download.side_effect = \
+        with patch('yt_dlp.YoutubeDL') as mock_ydl:
+            mock_ydl.return_value.download.side_effect = \
                 RuntimeError("Download failed")
 
             with patch('youtube_downloader.base_gui.messagebox'):
@@ -17,7 +17,7 @@ class TestAudioDownloadWorkflow:
     @pytest.fixture
     def audio_app(self, mock_tk_root, temp_dir):
         """Create a complete audio downloader application."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = temp_dir
@@ -36,7 +36,7 @@ class TestAudioDownloadWorkflow:
         audio_app.url_entry.get.return_value = url
         audio_app.playlist_var.get.return_value = False
 
-        with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
+        with patch('yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
             with patch('youtube_downloader.base_gui.messagebox') as mock_mb:
                 with patch('pathlib.Path.exists', return_value=True):
                     # Start download
@@ -68,7 +68,7 @@ class TestAudioDownloadWorkflow:
         audio_app.url_entry.get.return_value = url
         audio_app.playlist_var.get.return_value = True
 
-        with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
+        with patch('yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
             with patch('youtube_downloader.base_gui.messagebox') as mock_mb:
                 with patch('pathlib.Path.exists', return_value=True):
                     # Execute workflow
@@ -93,7 +93,7 @@ class TestVideoDownloadWorkflow:
     @pytest.fixture
     def video_app(self, mock_tk_root, temp_dir):
         """Create a complete video downloader application."""
-        with patch('youtube_downloader.video_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 with patch('youtube_downloader.video_downloader.logging'):
                     mock_config = MagicMock()
@@ -113,7 +113,7 @@ class TestVideoDownloadWorkflow:
         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         video_app.url_entry.get.return_value = url
 
-        with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
+        with patch('yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
             with patch('youtube_downloader.base_gui.messagebox') as mock_mb:
                 with patch('pathlib.Path.exists', return_value=True):
                     with patch('youtube_downloader.video_downloader.logging'):
@@ -147,8 +147,11 @@ class TestVideoDownloadWorkflow:
                         # Execute download
                         video_app.download_worker(url, ydl_opts)
 
-                        # Verify download completed
-                        mock_yt_dlp_success.download.assert_called_with([url])
+                        # Verify download completed from the extracted info
+                        mock_yt_dlp_success.extract_info.assert_called_once_with(
+                            url, download=False, process=False
+                        )
+                        mock_yt_dlp_success.process_ie_result.assert_called_once()
                         mock_mb.showinfo.assert_called_once()
 
 
@@ -189,7 +192,7 @@ class TestErrorRecoveryWorkflow:
     @pytest.fixture
     def audio_app(self, mock_tk_root, temp_dir):
         """Create audio app for error testing."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = temp_dir
@@ -208,7 +211,7 @@ class TestErrorRecoveryWorkflow:
         audio_app.url_entry.get.return_value = url
         audio_app.playlist_var.get.return_value = False
 
-        with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL', return_value=mock_yt_dlp_error):
+        with patch('yt_dlp.YoutubeDL', return_value=mock_yt_dlp_error):
             with patch('youtube_downloader.base_gui.messagebox') as mock_mb:
                 with patch('pathlib.Path.exists', return_value=True):
                     ydl_opts = {'format': 'bestaudio/best', 'noplaylist': True}
@@ -239,7 +242,7 @@ class TestThreadSafety:
     @pytest.fixture
     def video_app(self, mock_tk_root, temp_dir):
         """Create video app for thread testing."""
-        with patch('youtube_downloader.video_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 with patch('youtube_downloader.video_downloader.logging'):
                     mock_config = MagicMock()
@@ -273,8 +276,8 @@ class TestThreadSafety:
     def test_error_messages_use_after(self, video_app):
         """Test that error messages are scheduled via root.after."""
         with patch('youtube_downloader.base_gui.messagebox') as mock_mb:
-            with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL') as mock_ydl:
-                mock_ydl.return_value.__enter__.return_value.download.side_effect = Exception("Test error")
+            with patch('yt_dlp.YoutubeDL') as mock_ydl:
+                mock_ydl.return_value.download.side_effect = Exception("Test error")
 
                 ydl_opts = {'format': 'bestaudio'}
                 video_app.download_worker("https://www.youtube.com/watch?v=test", ydl_opts)
@@ -289,7 +292,7 @@ class TestClipboardIntegration:
     @pytest.fixture
     def audio_app(self, mock_tk_root, temp_dir):
         """Create audio app with clipboard support."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = temp_dir
@@ -328,7 +331,7 @@ class TestEndToEnd:
 
     def test_audio_app_full_lifecycle(self, mock_tk_root, temp_dir, mock_yt_dlp_success):
         """Test complete lifecycle of audio downloader."""
-        with patch('youtube_downloader.audio_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 mock_config = MagicMock()
                 mock_config.get_default_music_dir.return_value = temp_dir
@@ -347,7 +350,7 @@ class TestEndToEnd:
                 app.playlist_var.get.return_value = False
 
                 # Download
-                with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
+                with patch('yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
                     with patch('youtube_downloader.base_gui.messagebox') as mock_mb:
                         with patch('pathlib.Path.exists', return_value=True):
                             ydl_opts = {
@@ -367,7 +370,7 @@ class TestEndToEnd:
 
     def test_video_app_full_lifecycle(self, mock_tk_root, temp_dir, mock_yt_dlp_success):
         """Test complete lifecycle of video downloader."""
-        with patch('youtube_downloader.video_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
                 with patch('youtube_downloader.video_downloader.logging'):
                     mock_config = MagicMock()
@@ -386,7 +389,7 @@ class TestEndToEnd:
                     url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
                     app.url_entry.get.return_value = url
 
-                    with patch('youtube_downloader.base_gui.yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
+                    with patch('yt_dlp.YoutubeDL', return_value=mock_yt_dlp_success):
                         with patch('youtube_downloader.base_gui.messagebox') as mock_mb:
                             with patch('pathlib.Path.exists', return_value=True):
                                 ydl_opts = {
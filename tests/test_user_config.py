@@ -0,0 +1,86 @@
+"""Tests for user configuration module."""
+
+import json
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from youtube_downloader.user_config import UserConfig
+
+
+class TestUserConfig:
+    """Test cases for UserConfig class."""
+
+    @pytest.fixture
+    def user_config(self, tmp_path):
+        """Create a UserConfig that reads and writes under a temporary directory."""
+        config = UserConfig()
+        config.config_dir = tmp_path
+        config.config_file = tmp_path / "config.json"
+        yield config
+        config.close()
+
+    def test_load_is_lazy(self, user_config):
+        """Test that the file is only read on first access to the config."""
+        user_config.config_file.write_text(json.dumps({'video_quality': '720p'}))
+
+        with patch.object(UserConfig, 'load', wraps=user_config.load) as load:
+            assert load.call_count == 0
+            assert user_config.get_video_quality() == '720p'
+            user_config.get_audio_format()
+            assert load.call_count == 1
+
+    def test_load_reads_bytes(self, user_config):
+        """Test that UTF-8 content is decoded when loading from bytes."""
+        user_config.config_file.write_bytes(json.dumps({'last_audio_dir': '/tmp/müsic'}).encode('utf-8'))
+
+        assert user_config.get_last_audio_dir() == '/tmp/müsic'
+
+    def test_burst_of_sets_writes_once(self, user_config):
+        """Test that several set() calls within the delay result in a single save."""
+        user_config.config = {}
+        with patch.object(UserConfig, 'save') as save:
+            user_config.set('a', 1)
+            user_config.set('b', 2)
+            user_config.set_window_position('main', '600x150+0+0')
+            save.assert_not_called()
+
+            user_config.close()
+            save.assert_called_once()
+
+    def test_close_writes_pending_change(self, user_config):
+        """Test that close() writes the pending change immediately."""
+        user_config.config = {}
+        user_config.set('video_quality', '4K')
+        user_config.close()
+
+        assert json.loads(user_config.config_file.read_text()) == {'video_quality': '4K'}
+
+    def test_save_timer_does_not_block_exit(self, user_config):
+        """Test that the delayed save runs on a daemon thread."""
+        user_config.config = {}
+        user_config.set('a', 1)
+
+        assert user_config._save_timer is not None
+        assert user_config._save_timer.daemon
+
+    def test_failed_replace_keeps_original(self, user_config):
+        """Test that a failed rename leaves the old file intact and no temp file behind."""
+        user_config.config_file.write_text('{"video_quality":"720p"}')
+        user_config.config = {'video_quality': '4K'}
+
+        with patch('youtube_downloader.user_config.os.replace', side_effect=OSError("disk full")):
+            user_config.save()
+
+        assert user_config.config_file.read_text() == '{"video_quality":"720p"}'
+        assert list(user_config.config_dir.glob('*.tmp')) == []
+
+    def test_failed_serialization_removes_temp_file(self, user_config):
+        """Test that a value json can't encode doesn't leave a temp file behind."""
+        user_config.config = {'bad': object()}
+
+        with pytest.raises(TypeError):
+            user_config.save()
+
+        assert list(user_config.config_dir.glob('*.tmp')) == []
+        assert not user_config.config_file.exists()
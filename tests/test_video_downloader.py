@@ -14,9 +14,9 @@ class TestVideoDownloader:
     @pytest.fixture
     def video_gui(self, mock_tk_root):
         """Create a video downloader GUI instance for testing."""
-        with patch('youtube_downloader.video_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
-                with patch('youtube_downloader.video_downloader.logging'):
+                with patch('youtube_downloader.video_downloader.logger'):
                     mock_config = MagicMock()
                     mock_config.get_default_video_dir.return_value = Path("/tmp/test_videos")
                     mock_config.get_ffmpeg_path.return_value = "ffmpeg"
@@ -31,9 +31,9 @@ class TestVideoDownloader:
 
     def test_initialization(self, mock_tk_root):
         """Test video downloader initialization."""
-        with patch('youtube_downloader.video_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk'):
-                with patch('youtube_downloader.video_downloader.logging'):
+                with patch('youtube_downloader.video_downloader.logger'):
                     mock_config = MagicMock()
                     mock_config.get_default_video_dir.return_value = Path("/tmp/test_videos")
                     mock_config_class.return_value = mock_config
@@ -43,26 +43,19 @@ class TestVideoDownloader:
                     mock_tk_root.title.assert_called_with("YouTube Video Downloader (1080p)")
                     mock_tk_root.geometry.assert_called()
 
-    def test_setup_logging(self, mock_tk_root):
-        """Test logging setup."""
-        with patch('youtube_downloader.video_downloader.Config') as mock_config_class:
-            with patch('youtube_downloader.base_gui.ttk'):
-                with patch('youtube_downloader.video_downloader.logging.basicConfig') as mock_logging:
-                    with patch('pathlib.Path.mkdir'):
-                        mock_config = MagicMock()
-                        mock_config.get_default_video_dir.return_value = Path("/tmp/test")
-                        mock_config_class.return_value = mock_config
-
-                        gui = YouTubeVideoDownloaderGUI(mock_tk_root)
+    def test_setup_logging(self):
+        """Test that setup_logging delegates to the shared configure_logging."""
+        with patch('youtube_downloader.video_downloader.configure_logging') as mock_configure:
+            YouTubeVideoDownloaderGUI.setup_logging(MagicMock())
 
-                        assert mock_logging.called
+            mock_configure.assert_called_once_with()
 
     def test_download_video(self, video_gui):
         """Test downloading a video."""
         video_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
 
-        with patch('youtube_downloader.video_downloader.threading.Thread') as mock_thread:
-            with patch('youtube_downloader.video_downloader.logging'):
+        with patch.object(YouTubeVideoDownloaderGUI, '_start_download') as mock_thread:
+            with patch('youtube_downloader.video_downloader.logger'):
                 video_gui.download()
 
                 mock_thread.assert_called_once()
@@ -72,13 +65,11 @@ class TestVideoDownloader:
         """Test that download options are correctly set for 1080p."""
         video_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=test"
 
-        with patch('youtube_downloader.video_downloader.threading.Thread') as mock_thread:
-            with patch('youtube_downloader.video_downloader.logging'):
+        with patch.object(YouTubeVideoDownloaderGUI, '_start_download') as mock_thread:
+            with patch('youtube_downloader.video_downloader.logger'):
                 video_gui.download()
 
-                call_args = mock_thread.call_args
-                args = call_args[1]['args']
-                ydl_opts = args[1]
+                ydl_opts = mock_thread.call_args[0][1]
 
                 assert ydl_opts['format'] == 'bv*[height<=1080]+ba/b[height<=1080]'
                 assert ydl_opts['merge_output_format'] == 'mp4'
@@ -87,7 +78,7 @@ class TestVideoDownloader:
 
     def test_download_hook_downloading(self, video_gui, mock_download_progress):
         """Test download hook during download."""
-        with patch('youtube_downloader.video_downloader.logging'):
+        with patch('youtube_downloader.video_downloader.logger'):
             video_gui.download_hook(mock_download_progress)
 
             # Verify progress update was scheduled
@@ -95,11 +86,11 @@ class TestVideoDownloader:
 
     def test_download_hook_finished(self, video_gui, mock_download_finished):
         """Test download hook when download is finished."""
-        with patch('youtube_downloader.video_downloader.logging') as mock_logging:
+        with patch('youtube_downloader.video_downloader.logger') as mock_logger:
             video_gui.download_hook(mock_download_finished)
 
             # Verify logging
-            assert mock_logging.info.called
+            assert mock_logger.info.called
             # Verify progress update
             video_gui.root.after.assert_called()
 
@@ -113,7 +104,7 @@ class TestVideoDownloader:
             'eta': 5
         }
 
-        with patch('youtube_downloader.video_downloader.logging'):
+        with patch('youtube_downloader.video_downloader.logger'):
             video_gui.download_hook(progress_data)
 
             # Progress should be updated
@@ -129,7 +120,7 @@ class TestVideoDownloader:
             'eta': 0
         }
 
-        with patch('youtube_downloader.video_downloader.logging'):
+        with patch('youtube_downloader.video_downloader.logger'):
             video_gui.download_hook(progress_data)
 
             assert video_gui.root.after.called
@@ -141,7 +132,7 @@ class TestVideoDownloader:
             'downloaded_bytes': 5242880,
         }
 
-        with patch('youtube_downloader.video_downloader.logging'):
+        with patch('youtube_downloader.video_downloader.logger'):
             # Should not raise exception
             video_gui.download_hook(progress_data)
 
@@ -152,11 +143,11 @@ class TestVideoDownloader:
             'total_bytes': 'invalid',  # Invalid data type
         }
 
-        with patch('youtube_downloader.video_downloader.logging') as mock_logging:
+        with patch('youtube_downloader.video_downloader.logger') as mock_logger:
             # Should not raise exception
             video_gui.download_hook(progress_data)
             # Error should be logged
-            assert mock_logging.error.called
+            assert mock_logger.error.called
 
     def test_update_progress(self, video_gui):
         """Test progress update method."""
@@ -175,9 +166,9 @@ class TestVideoDownloader:
 
     def test_create_widgets(self, mock_tk_root):
         """Test widget creation including progress bar."""
-        with patch('youtube_downloader.video_downloader.Config') as mock_config_class:
+        with patch('youtube_downloader.base_gui.Config') as mock_config_class:
             with patch('youtube_downloader.base_gui.ttk') as mock_ttk:
-                with patch('youtube_downloader.video_downloader.logging'):
+                with patch('youtube_downloader.video_downloader.logger'):
                     mock_config = MagicMock()
                     mock_config.get_default_video_dir.return_value = Path("/tmp/test")
                     mock_config_class.return_value = mock_config
@@ -192,13 +183,11 @@ class TestVideoDownloader:
         """Test that progress hooks are properly configured."""
         video_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=test"
 
-        with patch('youtube_downloader.video_downloader.threading.Thread') as mock_thread:
-            with patch('youtube_downloader.video_downloader.logging'):
+        with patch.object(YouTubeVideoDownloaderGUI, '_start_download') as mock_thread:
+            with patch('youtube_downloader.video_downloader.logger'):
                 video_gui.download()
 
-                call_args = mock_thread.call_args
-                args = call_args[1]['args']
-                ydl_opts = args[1]
+                ydl_opts = mock_thread.call_args[0][1]
 
                 assert 'progress_hooks' in ydl_opts
                 assert len(ydl_opts['progress_hooks']) == 1
@@ -208,26 +197,46 @@ class TestVideoDownloader:
         """Test that postprocessor args are set correctly."""
         video_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=test"
 
-        with patch('youtube_downloader.video_downloader.threading.Thread') as mock_thread:
-            with patch('youtube_downloader.video_downloader.logging'):
+        with patch.object(YouTubeVideoDownloaderGUI, '_start_download') as mock_thread:
+            with patch('youtube_downloader.video_downloader.logger'):
                 video_gui.download()
 
-                call_args = mock_thread.call_args
-                ydl_opts = call_args[1]['args'][1]
+                ydl_opts = mock_thread.call_args[0][1]
 
                 assert 'postprocessor_args' in ydl_opts
                 assert '-c:v' in ydl_opts['postprocessor_args']
                 assert 'copy' in ydl_opts['postprocessor_args']
 
+    def test_download_hook_status_text(self):
+        """Test that the progress hook formats percentage, speed and ETA."""
+        import threading
+
+        gui = YouTubeVideoDownloaderGUI.__new__(YouTubeVideoDownloaderGUI)
+        gui._pending_progress = None
+        gui._progress_lock = threading.Lock()
+        gui._post_ui = MagicMock()
+
+        gui.download_hook({'status': 'downloading', 'total_bytes': 200, 'downloaded_bytes': 50,
+                           'speed': 3 * 1024 * 1024, 'eta': 7})
+
+        assert gui._pending_progress == (25.0, 'Downloading: 25.0% (Speed: 3.0 MB/s, ETA: 7s)')
+
+    def test_thread_limit_passes_sanitizer(self):
+        """Test that the ffmpeg -threads limit is on the postprocessor allowlist."""
+        gui = YouTubeVideoDownloaderGUI.__new__(YouTubeVideoDownloaderGUI)
+        args = ['-c:v', 'copy', '-c:a', 'copy', '-threads', '3']
+
+        assert gui._sanitize_postprocessor_args(args) == args
+
     def test_logging_on_download_start(self, video_gui):
         """Test that logging occurs when download starts."""
         video_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=test"
 
-        with patch('youtube_downloader.video_downloader.threading.Thread'):
-            with patch('youtube_downloader.video_downloader.logging') as mock_logging:
+        with patch.object(YouTubeVideoDownloaderGUI, '_start_download'):
+            with patch('youtube_downloader.video_downloader.logger') as mock_logger:
                 video_gui.download()
 
-                assert mock_logging.info.called
+                assert mock_logger.info.called
 
     def test_main_function(self):
         """Test main entry point function."""
@@ -241,16 +250,16 @@ class TestVideoDownloader:
 
                 mock_root.mainloop.assert_called_once()
 
-    def test_thread_daemon_mode(self, video_gui):
-        """Test that download thread runs in daemon mode."""
+    def test_download_uses_shared_worker(self, video_gui):
+        """Test that downloads are queued on the shared background loop."""
         video_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=test"
 
-        with patch('youtube_downloader.video_downloader.threading.Thread') as mock_thread:
-            with patch('youtube_downloader.video_downloader.logging'):
+        with patch.object(YouTubeVideoDownloaderGUI, '_start_download') as mock_start:
+            with patch('youtube_downloader.video_downloader.logger'):
                 video_gui.download()
 
-                call_args = mock_thread.call_args
-                assert call_args[1]['daemon'] is True
+                mock_start.assert_called_once()
+                assert mock_start.call_args[0][0] == "https://www.youtube.com/watch?v=test"
 
     @pytest.mark.parametrize("downloaded,total,expected_progress", [
         (5242880, 10485760, 50.0),
@@ -268,7 +277,7 @@ class TestVideoDownloader:
             'eta': 10
         }
 
-        with patch('youtube_downloader.video_downloader.logging'):
+        with patch('youtube_downloader.video_downloader.logger'):
             video_gui.download_hook(progress_data)
 
             # Check that progress update was called
@@ -283,12 +292,11 @@ class TestVideoDownloader:
         """Test concurrent fragment downloads setting."""
         video_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=test"
 
-        with patch('youtube_downloader.video_downloader.threading.Thread') as mock_thread:
-            with patch('youtube_downloader.video_downloader.logging'):
+        with patch.object(YouTubeVideoDownloaderGUI, '_start_download') as mock_thread:
+            with patch('youtube_downloader.video_downloader.logger'):
                 video_gui.download()
 
-                call_args = mock_thread.call_args
-                ydl_opts = call_args[1]['args'][1]
+                ydl_opts = mock_thread.call_args[0][1]
 
                 assert ydl_opts['concurrent_fragment_downloads'] == 3
 
@@ -296,12 +304,11 @@ class TestVideoDownloader:
         """Test that noplaylist is always True for video downloads."""
         video_gui.url_entry.get.return_value = "https://www.youtube.com/watch?v=test"
 
-        with patch('youtube_downloader.video_downloader.threading.Thread') as mock_thread:
-            with patch('youtube_downloader.video_downloader.logging'):
+        with patch.object(YouTubeVideoDownloaderGUI, '_start_download') as mock_thread:
+            with patch('youtube_downloader.video_downloader.logger'):
                 video_gui.download()
 
-                call_args = mock_thread.call_args
-                ydl_opts = call_args[1]['args'][1]
+                ydl_opts = mock_thread.call_args[0][1]
 
                 assert ydl_opts['noplaylist'] is True
 
@@ -315,7 +322,24 @@ class TestVideoDownloader:
             'eta': 5
         }
 
-        with patch('youtube_downloader.video_downloader.logging'):
+        with patch('youtube_downloader.video_downloader.logger'):
             video_gui.download_hook(progress_data)
 
             assert video_gui.root.after.called
+
+    def test_download_hook_keeps_latest_progress(self):
+        """Test that a burst of progress hooks draws only the newest value."""
+        import threading
+
+        gui = YouTubeVideoDownloaderGUI.__new__(YouTubeVideoDownloaderGUI)
+        gui._pending_progress = None
+        gui._progress_lock = threading.Lock()
+        gui._post_ui = MagicMock()
+        gui.update_progress = MagicMock()
+
+        for downloaded in (1, 2, 3):
+            gui.download_hook({'status': 'downloading', 'total_bytes': 4, 'downloaded_bytes': downloaded})
+
+        gui._post_ui.assert_called_once_with(gui._apply_pending_progress)
+        gui._apply_pending_progress()
+        gui.update_progress.assert_called_once_with(75.0, 'Downloading: 75.0%')
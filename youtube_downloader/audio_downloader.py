@@ -1,20 +1,24 @@
 """Audio downloader GUI for YouTube."""
 
-from typing import Any, Dict
+from typing import Any, Optional
+import copy
 import tkinter as tk
-from tkinter import ttk, messagebox
-import threading
+from tkinter import ttk
 import logging
+import sys
 from pathlib import Path
-import re
 
-from .base_gui import BaseYouTubeDownloaderGUI
-from .config import Config
+from .base_gui import (
+    BaseYouTubeDownloaderGUI, _cached_urlparse, _ffmpeg_thread_args, configure_logging
+)
 from .constants import (
     WINDOW_HEIGHT_AUDIO,
     WINDOW_WIDTH,
     AUDIO_FORMATS,
+    AUDIO_FORMAT_NAMES,
     DEFAULT_AUDIO_FORMAT,
+    ERROR_DISPLAY_MS,
+    ERROR_FG_COLOR,
     PADDING_LARGE,
     PADDING_MEDIUM,
     PADDING_SMALL
@@ -26,8 +30,12 @@ logger = logging.getLogger(__name__)
 # Security constants for audio downloads
 MAX_PLAYLIST_SIZE = 500  # Maximum number of videos in a playlist
 ALLOWED_AUDIO_CODECS = {'mp3', 'aac', 'opus', 'vorbis', 'flac', 'wav', 'm4a'}
+ALLOWED_POSTPROCESSOR_ARGS = frozenset({'-threads'})  # plus plain integer values
 MAX_AUDIO_QUALITY = 320  # Maximum bitrate for audio
 
+_GEOMETRY = f"{WINDOW_WIDTH}x{WINDOW_HEIGHT_AUDIO}"
+_ALNUM = frozenset(b'abcdefghijklmnopqrstuvwxyz0123456789')
+
 
 class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
     """GUI application for downloading YouTube audio.
@@ -51,6 +59,7 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
         progress_bar: Progress bar widget for download progress.
         status_label: Label displaying download status.
         cancel_btn: Button to cancel ongoing downloads.
+        _toast: Label showing validation errors without a modal dialog.
     """
 
     def __init__(self, root: tk.Tk) -> None:
@@ -63,15 +72,7 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
         Args:
             root: The main tkinter window instance.
         """
-        config: Config = Config()
-        # Load last used directory or default
-        output_dir = config.get_default_music_dir()
-        super().__init__(root, "YouTube Audio Downloader", output_dir)
-
-        # Check for saved directory preference
-        saved_dir = self.user_config.get_last_audio_dir()
-        if saved_dir:
-            self.output_dir = Path(saved_dir)
+        super().__init__(root, "YouTube Audio Downloader")
 
         # Instance variables
         self.playlist_var: tk.BooleanVar
@@ -81,9 +82,30 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
         self.progress_bar: ttk.Progressbar
         self.status_label: ttk.Label
         self.cancel_btn: ttk.Button
+        self._rows: ttk.Frame
+        self._toast: ttk.Label
+        self._toast_after: Optional[str] = None
+
+        # Sanitized download options keyed on (format, playlist mode)
+        self._opts_cache: dict[tuple[str, bool], dict[str, Any]] = {}
 
         self.create_widgets()
 
+    def _default_output_dir(self) -> Path:
+        """
+        Return the saved audio directory, or the platform default if none is saved.
+
+        The default directory is only looked up (and validated on disk) when
+        there is no saved preference.
+
+        Returns:
+            Starting output directory
+        """
+        saved_dir = self.user_config.get_last_audio_dir()
+        if saved_dir:
+            return Path(saved_dir)
+        return self.config.get_default_music_dir()
+
     def create_widgets(self) -> None:
         """Create all widgets for the audio downloader.
 
@@ -99,63 +121,69 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
         """
         self.create_base_widgets()
 
-        # Format Selection
-        format_frame: ttk.Frame = ttk.Frame(self.root)
-        format_frame.pack(padx=PADDING_LARGE, pady=(0, PADDING_MEDIUM), fill=tk.X)
+        # All audio widgets share one gridded container
+        self._rows = ttk.Frame(self.root)
+        self._rows.pack(fill=tk.BOTH, expand=True, padx=PADDING_LARGE)
+        self._rows.columnconfigure(2, weight=1)
 
-        ttk.Label(format_frame, text="Format:").pack(side=tk.LEFT)
+        # Format Selection
+        ttk.Label(self._rows, text="Format:").grid(row=0, column=0, sticky=tk.W,
+                                                   pady=(0, PADDING_MEDIUM))
 
         # Get saved format preference or use default
         saved_format = self.user_config.get_audio_format()
         self.format_var = tk.StringVar(value=saved_format)
 
         format_combo = ttk.Combobox(
-            format_frame,
+            self._rows,
             textvariable=self.format_var,
-            values=list(AUDIO_FORMATS.keys()),
+            values=AUDIO_FORMAT_NAMES,
             state='readonly',
             width=15
         )
-        format_combo.pack(side=tk.LEFT, padx=(PADDING_MEDIUM, 0))
+        format_combo.grid(row=0, column=1, sticky=tk.W, padx=(PADDING_MEDIUM, 0),
+                          pady=(0, PADDING_MEDIUM))
         format_combo.bind('<<ComboboxSelected>>', self.on_format_change)
 
         # Playlist checkbox
         self.playlist_var = tk.BooleanVar()
         self.playlist_check = ttk.Checkbutton(
-            self.root,
+            self._rows,
             text="Download Playlist",
             variable=self.playlist_var,
             style="TCheckbutton"
         )
-        self.playlist_check.pack(pady=(0, PADDING_MEDIUM))
+        self.playlist_check.grid(row=1, column=0, columnspan=3, sticky=tk.W,
+                                 pady=(0, PADDING_MEDIUM))
 
         # Progress Bar
-        progress_frame: ttk.Frame = ttk.Frame(self.root)
-        progress_frame.pack(fill=tk.X, padx=PADDING_LARGE, pady=(PADDING_MEDIUM, 0))
-
         self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(progress_frame, variable=self.progress_var,
+        self.progress_bar = ttk.Progressbar(self._rows, variable=self.progress_var,
                                            mode='determinate')
-        self.progress_bar.pack(fill=tk.X)
-
-        self.status_label = ttk.Label(progress_frame, text="")
-        self.status_label.pack(fill=tk.X, pady=(PADDING_SMALL, 0))
+        self.progress_bar.grid(row=2, column=0, columnspan=3, sticky=tk.EW,
+                               pady=(PADDING_MEDIUM, 0))
 
-        # Button Frame with Download and Cancel buttons
-        button_frame: ttk.Frame = ttk.Frame(self.root)
-        button_frame.pack(pady=PADDING_LARGE)
+        self.status_label = ttk.Label(self._rows, text="")
+        self.status_label.grid(row=3, column=0, columnspan=3, sticky=tk.EW,
+                               pady=(PADDING_SMALL, 0))
 
-        self.download_btn = ttk.Button(button_frame, text="Download Audio",
+        # Download and Cancel buttons
+        self.download_btn = ttk.Button(self._rows, text="Download Audio",
                                       command=self.download)
-        self.download_btn.pack(side=tk.LEFT, padx=(0, PADDING_MEDIUM))
+        self.download_btn.grid(row=4, column=0, sticky=tk.W, pady=PADDING_LARGE)
 
-        self.cancel_btn = ttk.Button(button_frame, text="Cancel",
+        self.cancel_btn = ttk.Button(self._rows, text="Cancel",
                                     command=self.cancel_download,
                                     state='disabled')
-        self.cancel_btn.pack(side=tk.LEFT)
+        self.cancel_btn.grid(row=4, column=1, sticky=tk.W, padx=(PADDING_MEDIUM, 0),
+                             pady=PADDING_LARGE)
+
+        # Inline error display (non-blocking replacement for error dialogs)
+        self._toast = ttk.Label(self._rows, text="", foreground=ERROR_FG_COLOR)
+        self._toast.grid(row=5, column=0, columnspan=3, sticky=tk.EW)
 
         # Adjust window size
-        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT_AUDIO}")
+        self.root.geometry(_GEOMETRY)
 
     def on_format_change(self, event: Any = None) -> None:
         """Save format preference when changed.
@@ -168,6 +196,7 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
         """
         audio_format = self.format_var.get()
         self.user_config.set_audio_format(audio_format)
+        self._opts_cache.clear()
 
     def save_directory_preference(self, directory: str) -> None:
         """Save audio directory preference.
@@ -198,15 +227,16 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
 
         # Check against whitelist
         if codec not in ALLOWED_AUDIO_CODECS:
-            logger.warning(f"Invalid audio codec requested: {codec}")
+            logger.warning("Invalid audio codec requested: %s", codec)
             raise ValueError(f"Unsupported audio codec. Allowed codecs: {', '.join(ALLOWED_AUDIO_CODECS)}")
 
         # Additional check: ensure no special characters that could enable injection
-        if not re.match(r'^[a-z0-9]+$', codec):
-            logger.warning(f"Audio codec contains invalid characters: {codec}")
+        codec_bytes = codec.encode('ascii', 'strict')
+        if not codec_bytes or not all(c in _ALNUM for c in codec_bytes):
+            logger.warning("Audio codec contains invalid characters: %s", codec)
             raise ValueError("Invalid codec format")
 
-        logger.info(f"Audio codec validated: {codec}")
+        logger.info("Audio codec validated: %s", codec)
         return codec
 
     def _validate_audio_quality(self, quality: str) -> str:
@@ -228,17 +258,36 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
 
             # Check reasonable bounds (8 kbps to 320 kbps)
             if quality_int < 8 or quality_int > MAX_AUDIO_QUALITY:
-                logger.warning(f"Audio quality out of bounds: {quality_int}")
+                logger.warning("Audio quality out of bounds: %s", quality_int)
                 raise ValueError(f"Audio quality must be between 8 and {MAX_AUDIO_QUALITY} kbps")
 
-            logger.info(f"Audio quality validated: {quality_int}")
+            logger.info("Audio quality validated: %s", quality_int)
             return str(quality_int)
 
         except ValueError:
-            logger.warning(f"Invalid audio quality value: {quality}")
+            logger.warning("Invalid audio quality value: %s", quality)
             raise ValueError("Audio quality must be a number")
 
-    def _sanitize_download_options(self, ydl_opts: Dict[str, Any]) -> Dict[str, Any]:
+    def _sanitize_postprocessor_args(self, args: list[str]) -> list[str]:
+        """
+        Keep only allowlisted ffmpeg arguments and plain integer values.
+
+        Args:
+            args: List of postprocessor arguments
+
+        Returns:
+            Sanitized argument list
+        """
+        allowed = [
+            arg for arg in args
+            if arg in ALLOWED_POSTPROCESSOR_ARGS or (arg.isascii() and arg.isdigit())
+        ]
+        if len(allowed) != len(args):
+            logger.warning("Removing potentially dangerous postprocessor args: %s",
+                           [arg for arg in args if arg not in allowed])
+        return allowed
+
+    def _sanitize_download_options(self, ydl_opts: dict[str, Any]) -> dict[str, Any]:
         """
         Sanitize yt-dlp download options to prevent command injection.
 
@@ -257,10 +306,14 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
                 if 'preferredquality' in pp:
                     pp['preferredquality'] = self._validate_audio_quality(pp['preferredquality'])
 
+        # Security: Only allowlisted ffmpeg arguments reach the postprocessor
+        if 'postprocessor_args' in ydl_opts:
+            ydl_opts['postprocessor_args'] = self._sanitize_postprocessor_args(ydl_opts['postprocessor_args'])
+
         # Security: Limit playlist size to prevent DoS
         if not ydl_opts.get('noplaylist', True):
             ydl_opts['playlistend'] = MAX_PLAYLIST_SIZE
-            logger.info(f"Playlist download limited to {MAX_PLAYLIST_SIZE} items")
+            logger.info("Playlist download limited to %s items", MAX_PLAYLIST_SIZE)
 
         # Security: Add timeout if not present
         if 'socket_timeout' not in ydl_opts:
@@ -270,7 +323,7 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
         dangerous_opts = ['exec', 'external_downloader_args']
         for opt in dangerous_opts:
             if opt in ydl_opts:
-                logger.warning(f"Removing dangerous option: {opt}")
+                logger.warning("Removing dangerous option: %s", opt)
                 del ydl_opts[opt]
 
         return ydl_opts
@@ -287,15 +340,17 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
         """
         # Call parent validation (includes sanitization)
         super().validate_url(url)
+        parsed = _cached_urlparse(url.strip())
 
         # Verify playlist URL if playlist mode is selected
-        if self.playlist_var.get() and "list=" not in url:
+        if self.playlist_var.get() and "list=" not in parsed.query:
             logger.warning("Playlist mode enabled but URL is not a playlist")
             raise ValueError("Not a valid YouTube playlist URL. Playlist URLs must contain 'list=' parameter.")
 
         # Security logging: Log download initiation (without full URL to avoid log injection)
-        url_domain = url.split('/')[2] if len(url.split('/')) > 2 else 'unknown'
-        logger.info(f"Audio download validation passed for domain: {url_domain}, playlist={self.playlist_var.get()}")
+        url_domain = parsed.hostname or 'unknown'
+        logger.info("Audio download validation passed for domain: %s, playlist=%s",
+                    url_domain, self.playlist_var.get())
 
     def download_hook(self, d: dict[str, Any]) -> None:
         """Hook for download progress updates.
@@ -328,19 +383,21 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
                         status_text: str = f'Downloading: {progress:.1f}%'
 
                     # Update progress bar in main thread
-                    self.root.after(0, lambda: self.update_progress(progress, status_text))
-            except Exception as e:
-                logging.error(f"Error updating progress: {str(e)}")
+                    self._post_ui(self.update_progress, progress, status_text)
+            except Exception:
+                logger.error("Error updating progress", exc_info=True)
         elif d['status'] == 'finished':
-            logging.info("Download completed!")
-            self.root.after(0, lambda: self.update_progress(100, "Processing audio..."))
+            logger.info("Download completed!")
+            self._post_ui(self.update_progress, 100, "Processing audio...")
+            # Guarantee the final state is painted before audio extraction starts
+            self._post_ui(self.root.update_idletasks)
 
     def update_progress(self, progress: float, status_text: str) -> None:
         """Update the progress bar and status label.
 
-        Safely updates UI elements from the download worker thread by
-        using the main thread. Forces UI refresh to ensure smooth
-        progress display.
+        Runs on the main thread (queued from the download worker via
+        _post_ui). Tk repaints on its next idle cycle, so no forced
+        refresh is done here.
 
         Args:
             progress: Progress percentage (0-100).
@@ -349,14 +406,32 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
         """
         self.progress_var.set(progress)
         self.status_label.config(text=status_text)
-        self.root.update_idletasks()
+
+    def _show_error(self, message: str) -> None:
+        """Show an error inline and clear it after a few seconds.
+
+        Unlike messagebox.showerror this doesn't enter a nested event loop,
+        so the window stays responsive while the message is visible.
+
+        Args:
+            message: Error message to display.
+        """
+        if self._toast_after is not None:
+            self.root.after_cancel(self._toast_after)
+        self._toast.config(text=message)
+        self._toast_after = self.root.after(ERROR_DISPLAY_MS, self._clear_error)
+
+    def _clear_error(self) -> None:
+        """Clear the inline error message."""
+        self._toast_after = None
+        self._toast.config(text="")
 
     def download(self) -> None:
         """
         Start the audio download process with security validations.
 
-        Applies input sanitization, validates download options, and starts
-        the download worker thread with sanitized parameters.
+        Applies input sanitization, validates download options, and queues
+        the download for the worker thread with sanitized parameters.
         """
         try:
             # Security: Get and strip URL (further validation in worker)
@@ -374,46 +449,53 @@ class YouTubeAudioDownloaderGUI(BaseYouTubeDownloaderGUI):
 
             # Get selected format
             selected_format = self.format_var.get()
-            format_config = AUDIO_FORMATS.get(selected_format, AUDIO_FORMATS[DEFAULT_AUDIO_FORMAT])
-
-            # Build download options
-            ydl_opts: dict[str, Any] = {
-                'format': 'bestaudio/best',
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': format_config['codec'],
-                    'preferredquality': format_config['quality'],
-                }],
-                'progress_hooks': [self.download_hook],
-                'noplaylist': not self.playlist_var.get()
-            }
-
-            # Security: Sanitize download options to prevent command injection
-            ydl_opts = self._sanitize_download_options(ydl_opts)
+            cache_key = (selected_format, bool(self.playlist_var.get()))
+
+            cached_opts = self._opts_cache.get(cache_key)
+            if cached_opts is None:
+                format_config = AUDIO_FORMATS.get(sys.intern(selected_format), AUDIO_FORMATS[DEFAULT_AUDIO_FORMAT])
+
+                # Build download options
+                ydl_opts: dict[str, Any] = {
+                    'format': 'bestaudio/best',
+                    'postprocessors': [{
+                        'key': 'FFmpegExtractAudio',
+                        'preferredcodec': format_config['codec'],
+                        'preferredquality': format_config['quality'],
+                    }],
+                    'noplaylist': not cache_key[1]
+                }
+                thread_args = _ffmpeg_thread_args()
+                if thread_args:
+                    ydl_opts['postprocessor_args'] = thread_args
+
+                # Security: Sanitize download options to prevent command injection
+                ydl_opts = self._sanitize_download_options(ydl_opts)
+                self._opts_cache[cache_key] = copy.deepcopy(ydl_opts)
+            else:
+                ydl_opts = copy.deepcopy(cached_opts)
+
+            ydl_opts['progress_hooks'] = [self.download_hook]
 
             # Log download initiation
-            logger.info(f"Starting audio download - Format: {selected_format}, Playlist: {not ydl_opts['noplaylist']}")
+            logger.info("Starting audio download - Format: %s, Playlist: %s",
+                        selected_format, not ydl_opts['noplaylist'])
 
-            # Start download thread
-            self.download_thread = threading.Thread(
-                target=self.download_worker,
-                args=(url, ydl_opts),
-                daemon=True
-            )
-            self.download_thread.start()
+            # Hand off to the persistent download worker
+            self._start_download(url, ydl_opts)
 
         except ValueError as e:
             # Show validation errors to user
-            messagebox.showerror("Validation Error", str(e))
+            self._show_error(str(e))
             self.download_btn.config(state='normal')
             self.cancel_btn.config(state='disabled')
-            logger.warning(f"Download validation failed: {e}")
+            logger.warning("Download validation failed: %s", e)
         except Exception as e:
             # Catch any unexpected errors
-            messagebox.showerror("Error", "An unexpected error occurred. Please try again.")
+            self._show_error("An unexpected error occurred. Please try again.")
             self.download_btn.config(state='normal')
             self.cancel_btn.config(state='disabled')
-            logger.error(f"Unexpected error in download initiation: {e}", exc_info=True)
+            logger.error("Unexpected error in download initiation: %s", e, exc_info=True)
 
 
 def main() -> None:
@@ -423,6 +505,7 @@ def main() -> None:
     GUI, and starts the main event loop. This function is called when
     the module is run directly or via the yt-audio console script.
     """
+    configure_logging()
     root: tk.Tk = tk.Tk()
     app: YouTubeAudioDownloaderGUI = YouTubeAudioDownloaderGUI(root)
     root.mainloop()
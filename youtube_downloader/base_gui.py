@@ -1,18 +1,30 @@
 """Base GUI class with shared functionality for YouTube downloaders."""
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Final, Optional
+from collections import OrderedDict
+import atexit
+import copy
+import functools
+import json
+import operator
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
-import validators
+import asyncio
+import concurrent.futures
+import queue
 from pathlib import Path
-import yt_dlp
 import re
 import urllib.parse
-import shutil
+import tempfile
 import time
 import logging
 
+if TYPE_CHECKING:
+    import yt_dlp
+
 from .config import Config
 from .user_config import UserConfig
 from .constants import (
@@ -20,19 +32,395 @@ from .constants import (
     BG_COLOR_DARK, BG_COLOR_DARKER, FG_COLOR, FG_COLOR_DARK,
     HIGHLIGHT_COLOR, SELECT_BG_COLOR,
     PADDING_LARGE, PADDING_MEDIUM,
-    FONT_DEFAULT, FONT_ENTRY
+    FONT_DEFAULT, FONT_ENTRY, OUTPUT_LABEL_PREFIX, DARK_THEME_NAME,
+    LOG_DIR, LOG_DATE_FORMAT, LOG_FORMAT
 )
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Security constants
-MAX_URL_LENGTH = 2048
-MAX_FILENAME_LENGTH = 255
-ALLOWED_FILENAME_CHARS = re.compile(r'^[a-zA-Z0-9_\-\.\s\(\)\[\]]+$')
-MIN_FREE_SPACE_BYTES = 500 * 1024 * 1024  # 500MB minimum free space
-MAX_RETRIES = 3
-INITIAL_RETRY_DELAY = 2  # seconds
+MAX_URL_LENGTH: Final[int] = 2048
+MAX_FILENAME_LENGTH: Final[int] = 255
+ALLOWED_FILENAME_CHARS: Final[re.Pattern[str]] = re.compile(r'^[a-zA-Z0-9_\-\.\s\(\)\[\]]+$')
+DANGEROUS_URL_CHARS: Final[re.Pattern[str]] = re.compile(r'[<>"{}|\\^`]')
+MIN_FREE_SPACE_BYTES: Final[int] = 500 * 1024 * 1024  # 500MB minimum free space
+MAX_RETRIES: Final[int] = 3
+INITIAL_RETRY_DELAY: Final[int] = 2  # seconds
+# Filename-only output template; path components come from the sanitized output dir
+SAFE_OUTPUT_TEMPLATE: Final[str] = '%(title).200s.%(ext)s'  # Limit title length
+# Download errors that retrying won't fix
+NON_RETRYABLE_ERRORS: Final[re.Pattern[str]] = re.compile('|'.join(map(re.escape, (
+    'video unavailable',
+    'private video',
+    'age-restricted',
+    'invalid url',
+    'not a youtube url',
+    'permission denied',
+    'disk space',
+))), re.IGNORECASE)
+DISK_FREE_TTL: Final[float] = 5.0  # seconds a free-space reading is reused
+# Seconds extracted video info is reused; its stream URLs expire after a few hours
+INFO_CACHE_TTL: Final[float] = 30 * 60
+UI_DRAIN_DELAY_MS: Final[int] = 50  # batch worker-thread UI updates into one Tk callback
+YOUTUBE_HOSTS: Final[frozenset[str]] = frozenset({
+    "youtube.com", "www.youtube.com", "m.youtube.com", "music.youtube.com", "youtu.be",
+})
+
+# Window size, formatted once rather than on every instantiation
+_GEOMETRY: Final[str] = f"{WINDOW_WIDTH}x{WINDOW_HEIGHT_BASE}"
+
+# User-facing messages for generic download errors, checked in order
+_ERROR_PATTERNS: Final[tuple[tuple[re.Pattern[str], str], ...]] = (
+    (re.compile(r'network|connection|timeout', re.IGNORECASE),
+     "Network error occurred. Please check your internet connection and try again."),
+    (re.compile(r'permission|access denied', re.IGNORECASE),
+     "Permission error. Please check that you have write access to the output directory."),
+    (re.compile(r'disk|space', re.IGNORECASE),
+     "Insufficient disk space. Please free up space and try again."),
+    (re.compile(r'ffmpeg', re.IGNORECASE),
+     "FFmpeg error. Please ensure FFmpeg is properly installed."),
+    (re.compile(r'video unavailable|private video', re.IGNORECASE),
+     "Video is unavailable or private. Please check the URL."),
+    (re.compile(r'age.*restricted|restricted.*age', re.IGNORECASE | re.DOTALL),
+     "Video is age-restricted and cannot be downloaded."),
+)
+
+# YoutubeDL is not fully thread-safe for stateful calls, so a cached instance
+# is used by one download at a time: it is taken out of _ydl_cache under this
+# lock and put back when the download ends.
+_YDL_LOCK = threading.Lock()
+_YDL_CACHE_SIZE: Final[int] = 4
+
+# Root logging is configured by the first configure_logging() call only
+_log_lock = threading.Lock()
+_log_configured = False
+
+
+def configure_logging() -> None:
+    """
+    Send INFO and above to the console and to a daily log file.
+
+    Every entry point calls this before building its GUI. Only the first
+    call in a process attaches the handlers, so later calls are no-ops.
+    """
+    global _log_configured
+    with _log_lock:
+        if _log_configured:
+            return
+        formatter = logging.Formatter(LOG_FORMAT)
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        log_dir: Path = Path(LOG_DIR)
+        log_dir.mkdir(exist_ok=True)
+        file_handler = logging.FileHandler(
+            log_dir / f"downloader_{time.strftime(LOG_DATE_FORMAT)}.log", encoding='utf-8'
+        )
+        file_handler.setFormatter(formatter)
+        root_logger = logging.getLogger()
+        root_logger.addHandler(console_handler)
+        root_logger.addHandler(file_handler)
+        root_logger.setLevel(logging.INFO)
+        _log_configured = True
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert nested yt-dlp options into a hashable cache key.
+
+    Args:
+        value: Option value (dicts and lists are converted recursively)
+
+    Returns:
+        Hashable representation that can be restored with _thaw
+    """
+    if isinstance(value, dict):
+        items = sorted(((k, _freeze(v)) for k, v in value.items()), key=operator.itemgetter(0))
+        return (dict, tuple(items))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(v) for v in value))
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Restore options frozen by _freeze."""
+    if isinstance(value, tuple) and len(value) == 2 and value[0] in (dict, list):
+        if value[0] is dict:
+            return {k: _thaw(v) for k, v in value[1]}
+        return [_thaw(v) for v in value[1]]
+    return value
+
+
+def _lower_worker_priority() -> None:
+    """
+    Keep the download worker off one CPU and at a lower priority.
+
+    On Linux, affinity and niceness are per-thread and inherited by the
+    ffmpeg processes the worker spawns, so heavy transcodes leave a core
+    free for the Tk main loop. No-op on other platforms.
+    """
+    if not sys.platform.startswith('linux'):
+        return
+    try:
+        cpus = os.sched_getaffinity(0)
+        if len(cpus) > 1:
+            os.sched_setaffinity(0, cpus - {min(cpus)})
+        os.nice(5)
+    except OSError:
+        pass
+
+
+def _ffmpeg_thread_args() -> list[str]:
+    """
+    Return an ffmpeg -threads limit matching the download worker's CPUs.
+
+    Subclasses add these to postprocessor_args before sanitizing, so they
+    pass through the same allowlist as every other argument. The worker
+    gives up one CPU in _lower_worker_priority, so the limit leaves it out.
+    Empty on platforms other than Linux.
+
+    Returns:
+        ['-threads', count] on Linux, otherwise an empty list
+    """
+    if not sys.platform.startswith('linux'):
+        return []
+    cpus = len(os.sched_getaffinity(0))
+    return ['-threads', str(cpus - 1 if cpus > 1 else 1)]
+
+
+# path -> (monotonic timestamp, free bytes)
+_disk_free_cache: dict[str, tuple[float, int]] = {}
+
+
+def _disk_free_bytes(path: str) -> int:
+    """
+    Return free bytes available to the user on the filesystem holding path.
+
+    Readings are reused for DISK_FREE_TTL seconds so repeated checks of the
+    same directory don't each cost a statvfs call.
+
+    Args:
+        path: Directory path as a string
+
+    Returns:
+        Free bytes available to unprivileged users
+    """
+    now = time.monotonic()
+    cached = _disk_free_cache.get(path)
+    if cached is not None and now - cached[0] < DISK_FREE_TTL:
+        return cached[1]
+
+    if os.name == 'posix':
+        # Only the free count is needed, so skip disk_usage's namedtuple
+        st = os.statvfs(path)
+        free = st.f_bavail * st.f_frsize
+    else:
+        # Windows has no statvfs; shutil is only needed here
+        import shutil
+        free = shutil.disk_usage(path).free
+    _disk_free_cache[path] = (now, free)
+    return free
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_urlparse(url: str) -> urllib.parse.ParseResult:
+    """
+    Parse a URL, reusing the result for strings seen recently.
+
+    The same URL is typically parsed on paste, validation and download,
+    and urllib's own cache only holds a handful of entries.
+
+    Args:
+        url: Stripped URL string
+
+    Returns:
+        Parsed URL
+    """
+    return urllib.parse.urlparse(url)
+
+
+# video id (or URL) -> (monotonic timestamp, unprocessed info from extract_info)
+_info_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+def _info_cache_key(url: str) -> str:
+    """
+    Reduce a YouTube URL to its video id so variants share one cache entry.
+
+    Args:
+        url: Validated YouTube URL
+
+    Returns:
+        Video id, or the URL itself if no id can be found
+    """
+    parsed = _cached_urlparse(url)
+    if (parsed.hostname or "").lower() == "youtu.be":
+        video_id = parsed.path.lstrip("/")
+    else:
+        video_id = urllib.parse.parse_qs(parsed.query).get("v", [""])[0]
+    return video_id or url
+
+
+def _extract_info_cached(ydl: "yt_dlp.YoutubeDL", url: str) -> dict[str, Any]:
+    """
+    Return yt-dlp's unprocessed info for url, extracting it at most once per TTL.
+
+    Extraction is the slow network step before a download starts, and its
+    result doesn't depend on the format options, so re-downloading a video
+    at another quality can skip it.
+
+    Args:
+        ydl: YoutubeDL instance used for extraction on a cache miss
+        url: Validated YouTube URL
+
+    Returns:
+        Copy of the info dict, safe for yt-dlp to modify while processing
+    """
+    key = _info_cache_key(url)
+    now = time.monotonic()
+    cached = _info_cache.get(key)
+    if cached is None or now - cached[0] >= INFO_CACHE_TTL:
+        cached = (now, ydl.extract_info(url, download=False, process=False))
+        _info_cache[key] = cached
+    return copy.deepcopy(cached[1])
+
+
+def _download_with_info(ydl: "yt_dlp.YoutubeDL", info: dict[str, Any]) -> int:
+    """
+    Download from already-extracted info through yt-dlp's public entry point.
+
+    download_with_info_file() runs the same wrapper as download(), including
+    retcode tracking and a retry from the webpage URL when the info has gone
+    stale, but it only reads from a file, so the info is written to a
+    temporary JSON file first.
+
+    Args:
+        ydl: YoutubeDL instance to download with
+        info: Info dict from _extract_info_cached; modified while serializing
+
+    Returns:
+        yt-dlp's retcode, non-zero if a download failed without raising
+    """
+    fd, info_path = tempfile.mkstemp(suffix='.info.json')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(ydl.sanitize_info(info), f)
+        return int(ydl.download_with_info_file(info_path))
+    finally:
+        os.unlink(info_path)
+
+
+class _HookRelay:
+    """
+    Progress hook registered once on a cached YoutubeDL.
+
+    It forwards to the hooks of whichever download currently holds the
+    instance, so per-download hooks never have to be removed from yt-dlp.
+    """
+
+    __slots__ = ('hooks',)
+
+    def __init__(self) -> None:
+        self.hooks: list[Callable[[dict[str, Any]], None]] = []
+
+    def __call__(self, d: dict[str, Any]) -> None:
+        for hook in self.hooks:
+            hook(d)
+
+
+# frozen options (without hooks) -> idle (YoutubeDL, hook relay), least recently used first
+_ydl_cache: "OrderedDict[Any, tuple[yt_dlp.YoutubeDL, _HookRelay]]" = OrderedDict()
+
+
+def _reset_ydl(ydl: "yt_dlp.YoutubeDL") -> bool:
+    """
+    Clear the per-run counters a YoutubeDL keeps between downloads.
+
+    yt-dlp has no public reset, so this writes its private _download_retcode
+    and _num_downloads. If an upgrade renames them the instance is reported
+    as not reusable instead of being left half-reset.
+
+    Args:
+        ydl: Idle YoutubeDL taken from the cache
+
+    Returns:
+        True if the instance was reset and can run another download
+    """
+    if not (hasattr(ydl, '_download_retcode') and hasattr(ydl, '_num_downloads')):
+        return False
+    ydl._download_retcode = 0
+    ydl._num_downloads = 0
+    return True
+
+
+def _checkout_ydl(opts_key: Any) -> tuple["yt_dlp.YoutubeDL", _HookRelay]:
+    """
+    Take an idle YoutubeDL for the given frozen options, building one if needed.
+
+    Building a YoutubeDL re-initializes extractors and the cookiejar, so
+    instances are reused across downloads with identical options. The caller
+    owns the instance until _checkin_ydl, so the download itself runs
+    without holding _YDL_LOCK.
+
+    Args:
+        opts_key: Options frozen with _freeze; must not contain hooks,
+            which are set on the returned relay instead
+
+    Returns:
+        (YoutubeDL, hook relay) pair
+    """
+    with _YDL_LOCK:
+        entry = _ydl_cache.pop(opts_key, None)
+    if entry is not None:
+        if _reset_ydl(entry[0]):
+            return entry
+        entry[0].close()
+
+    # yt-dlp loads hundreds of extractor modules, so it is imported on first
+    # download (on the worker thread) rather than at GUI startup
+    import yt_dlp
+
+    relay = _HookRelay()
+    opts = _thaw(opts_key)
+    opts['progress_hooks'] = [relay]
+    return yt_dlp.YoutubeDL(opts), relay
+
+
+def _checkin_ydl(opts_key: Any, entry: tuple["yt_dlp.YoutubeDL", _HookRelay]) -> None:
+    """
+    Return an instance taken with _checkout_ydl for later downloads.
+
+    The least recently used instances beyond _YDL_CACHE_SIZE are closed.
+
+    Args:
+        opts_key: Key the instance was checked out with
+        entry: (YoutubeDL, hook relay) pair from _checkout_ydl
+    """
+    entry[1].hooks = []
+    evicted = []
+    with _YDL_LOCK:
+        # Another GUI may have returned an instance for the same options meanwhile
+        displaced = _ydl_cache.pop(opts_key, None)
+        if displaced is not None:
+            evicted.append(displaced)
+        _ydl_cache[opts_key] = entry
+        while len(_ydl_cache) > _YDL_CACHE_SIZE:
+            evicted.append(_ydl_cache.popitem(last=False)[1])
+    for ydl, _ in evicted:
+        ydl.close()
+
+
+@atexit.register
+def _close_ydls() -> None:
+    """Close every cached YoutubeDL, saving cookies and releasing its connections."""
+    with _YDL_LOCK:
+        entries = list(_ydl_cache.values())
+        _ydl_cache.clear()
+    for ydl, _ in entries:
+        try:
+            ydl.close()
+        except Exception:
+            logger.warning("Failed to close YoutubeDL instance", exc_info=True)
 
 
 class BaseYouTubeDownloaderGUI:
@@ -52,50 +440,106 @@ class BaseYouTubeDownloaderGUI:
         config: Config instance for platform-specific settings.
         user_config: UserConfig instance for user preferences.
         output_dir: Path object representing the output directory.
-        download_thread: Thread instance for download operations.
+        download_thread: Thread running the asyncio loop that coordinates downloads.
         cancel_flag: Threading event for download cancellation.
         url_entry: Entry widget for URL input.
         dir_label: Label widget displaying the current output directory.
         download_btn: Button widget to trigger downloads.
     """
 
-    def __init__(self, root: tk.Tk, title: str, output_dir: Path) -> None:
+    # Reuse extracted info across downloads of the same video. Only safe for
+    # single-video downloads, since playlist extraction yields lazy entries.
+    _reuse_info: bool = False
+
+    def __init__(self, root: tk.Tk, title: str, output_dir: Optional[Path] = None) -> None:
         """Initialize the base YouTube downloader GUI.
 
         Args:
             root: The main tkinter window instance.
             title: Window title to display.
-            output_dir: Default output directory path for downloads.
+            output_dir: Default output directory path for downloads. If
+                None, _default_output_dir() is called once the configs
+                are loaded.
         """
         self.root: tk.Tk = root
         self.root.title(title)
-        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT_BASE}")
+        self.root.geometry(_GEOMETRY)
 
         # Configure dark theme
         self.style: ttk.Style = ttk.Style()
-        self.style.configure(".", background=BG_COLOR_DARK, foreground=FG_COLOR)
-        self.style.configure("TFrame", background=BG_COLOR_DARK)
-        self.style.configure("TLabel", background=BG_COLOR_DARK, foreground=FG_COLOR)
-        self.style.configure("TButton", background=FG_COLOR, foreground=FG_COLOR_DARK,
-                           padding=PADDING_MEDIUM, font=FONT_DEFAULT)
-        self.style.configure("TCheckbutton", background=BG_COLOR_DARK, foreground=FG_COLOR)
+        self._apply_dark_theme(self.style)
 
         self.root.configure(bg=BG_COLOR_DARK)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.config: Config = Config()
         self.user_config: UserConfig = UserConfig()
-        self.output_dir: Path = output_dir
+        self.output_dir: Path = output_dir if output_dir is not None else self._default_output_dir()
+
+        # Output directories must stay under home, current working dir, or temp;
+        # resolved once here rather than on every download
+        self._allowed_roots: tuple[Path, ...] = tuple(dict.fromkeys(
+            p.resolve() for p in (Path.home(), Path.cwd(), Path(tempfile.gettempdir()))
+        ))
+        # Separator-terminated prefixes so containment is a plain string check
+        self._allowed_root_prefixes: tuple[str, ...] = tuple(
+            os.path.normcase(os.fspath(p)).rstrip(os.sep) + os.sep for p in self._allowed_roots
+        )
+
+        # Output template for the directory it was built for
+        self._output_template: Optional[tuple[Path, dict[str, str]]] = None
 
         # Thread management for cancellation
         self.download_thread: Optional[threading.Thread] = None
         self.cancel_flag: threading.Event = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._download_future: Optional[concurrent.futures.Future[None]] = None
+
+        # UI updates posted from worker threads, applied in batches on the main thread
+        self._ui_queue: queue.SimpleQueue[tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]] = queue.SimpleQueue()
+        self._ui_lock: threading.Lock = threading.Lock()
+        self._ui_drain_pending: bool = False
 
         # Widgets that will be created by subclasses
         self.url_entry: tk.Entry
         self.dir_label: ttk.Label
+        self._dir_var: tk.StringVar
         self.download_btn: ttk.Button
 
-    def _sanitize_url(self, url: str) -> str:
+    def _default_output_dir(self) -> Path:
+        """
+        Return the output directory to use when none is passed to __init__.
+
+        Subclasses override this to consult their saved preference first.
+
+        Returns:
+            Starting output directory
+        """
+        return Path.home() / "Downloads"
+
+    @classmethod
+    def _apply_dark_theme(cls, style: ttk.Style) -> None:
+        """
+        Switch to the dark theme, defining it on first use.
+
+        The theme is created once per Tcl interpreter in a single call and
+        inherits from the current theme, so later windows only select it.
+
+        Args:
+            style: Style object for the application's Tk interpreter
+        """
+        if DARK_THEME_NAME not in style.theme_names():
+            style.theme_create(DARK_THEME_NAME, parent=style.theme_use(), settings={
+                ".": {"configure": {"background": BG_COLOR_DARK, "foreground": FG_COLOR}},
+                "TFrame": {"configure": {"background": BG_COLOR_DARK}},
+                "TLabel": {"configure": {"background": BG_COLOR_DARK, "foreground": FG_COLOR}},
+                "TButton": {"configure": {"background": FG_COLOR, "foreground": FG_COLOR_DARK,
+                                          "padding": PADDING_MEDIUM, "font": FONT_DEFAULT}},
+                "TCheckbutton": {"configure": {"background": BG_COLOR_DARK, "foreground": FG_COLOR}},
+            })
+        style.theme_use(DARK_THEME_NAME)
+
+    def _sanitize_url(self, url: str) -> tuple[str, urllib.parse.ParseResult]:
         """
         Sanitize and validate URL to prevent security issues.
 
@@ -103,7 +547,7 @@ class BaseYouTubeDownloaderGUI:
             url: The URL to sanitize
 
         Returns:
-            Sanitized URL string
+            Tuple of the sanitized URL string and its parsed form
 
         Raises:
             ValueError: If URL fails security checks
@@ -113,29 +557,28 @@ class BaseYouTubeDownloaderGUI:
 
         # Check length to prevent DoS
         if len(url) > MAX_URL_LENGTH:
-            logger.warning(f"URL exceeds maximum length: {len(url)} > {MAX_URL_LENGTH}")
+            logger.warning("URL exceeds maximum length: %d > %d", len(url), MAX_URL_LENGTH)
             raise ValueError("URL is too long")
 
         # Parse URL to validate structure
         try:
-            parsed = urllib.parse.urlparse(url)
+            parsed = _cached_urlparse(url)
         except Exception as e:
-            logger.warning(f"URL parsing failed: {e}")
+            logger.warning("URL parsing failed: %s", e)
             raise ValueError("Invalid URL format")
 
         # Ensure scheme is http or https
         if parsed.scheme not in ('http', 'https'):
-            logger.warning(f"Invalid URL scheme: {parsed.scheme}")
+            logger.warning("Invalid URL scheme: %s", parsed.scheme)
             raise ValueError("URL must use http or https")
 
         # Check for potentially dangerous characters
-        dangerous_chars = ['<', '>', '"', '{', '}', '|', '\\', '^', '`']
-        if any(char in url for char in dangerous_chars):
+        if DANGEROUS_URL_CHARS.search(url):
             logger.warning("URL contains dangerous characters")
             raise ValueError("URL contains invalid characters")
 
-        logger.info(f"URL sanitized successfully")
-        return url
+        logger.info("URL sanitized successfully")
+        return url, parsed
 
     def _sanitize_output_dir(self, output_dir: Path) -> Path:
         """
@@ -148,35 +591,26 @@ class BaseYouTubeDownloaderGUI:
             Sanitized and resolved Path object
         """
         try:
-            # Resolve to absolute path and eliminate any .. or symlinks
+            # Resolve to absolute path and eliminate any .. or symlinks, so a
+            # link anywhere along the path can't lead outside the allowed roots
             resolved_path = output_dir.resolve()
 
             # Security check: ensure path doesn't escape to system directories
-            # Allow only paths under home, current working dir, or temp
-            import tempfile
-            allowed_roots = [Path.home(), Path.cwd(), Path(tempfile.gettempdir())]
-
-            is_allowed = False
-            for root in allowed_roots:
-                try:
-                    resolved_path.relative_to(root.resolve())
-                    is_allowed = True
-                    break
-                except ValueError:
-                    continue
+            path_prefix = os.path.normcase(os.fspath(resolved_path)) + os.sep
+            is_allowed = path_prefix.startswith(self._allowed_root_prefixes)
 
             if not is_allowed:
-                logger.warning(f"Output directory outside allowed paths: {resolved_path}")
+                logger.warning("Output directory outside allowed paths: %s", resolved_path)
                 # Fallback to safe default
                 safe_default = Path.home() / "Downloads"
-                logger.info(f"Using safe fallback directory: {safe_default}")
+                logger.info("Using safe fallback directory: %s", safe_default)
                 return safe_default.resolve()
 
-            logger.info(f"Output directory sanitized: {resolved_path}")
+            logger.info("Output directory sanitized: %s", resolved_path)
             return resolved_path
 
         except Exception as e:
-            logger.error(f"Error sanitizing output directory: {e}")
+            logger.error("Error sanitizing output directory: %s", e)
             # Return safe fallback
             return (Path.home() / "Downloads").resolve()
 
@@ -192,19 +626,19 @@ class BaseYouTubeDownloaderGUI:
             True if sufficient space, False otherwise
         """
         try:
-            stat = shutil.disk_usage(directory)
-            free_space_mb = stat.free / (1024 * 1024)
-            required_mb = required_bytes / (1024 * 1024)
+            free = _disk_free_bytes(os.fspath(directory))
 
-            if stat.free < required_bytes:
-                logger.warning(f"Insufficient disk space: {free_space_mb:.1f}MB free, {required_mb:.1f}MB required")
+            if free < required_bytes:
+                logger.warning("Insufficient disk space: %.1fMB free, %.1fMB required",
+                               free / (1024 * 1024), required_bytes / (1024 * 1024))
                 return False
 
-            logger.info(f"Disk space check passed: {free_space_mb:.1f}MB available")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Disk space check passed: %.1fMB available", free / (1024 * 1024))
             return True
 
         except Exception as e:
-            logger.error(f"Error checking disk space: {e}")
+            logger.error("Error checking disk space: %s", e)
             # On error, allow operation but log warning
             return True
 
@@ -228,7 +662,7 @@ class BaseYouTubeDownloaderGUI:
                 "Please install FFmpeg and ensure it's in your system PATH."
             )
 
-        logger.info(f"FFmpeg validated: {validated_path}")
+        logger.info("FFmpeg validated: %s", validated_path)
 
     def _sanitize_generic_error(self, error: Exception) -> str:
         """
@@ -240,29 +674,15 @@ class BaseYouTubeDownloaderGUI:
         Returns:
             User-friendly error message
         """
-        error_str = str(error).lower()
+        error_str = str(error)
 
         # Map specific errors to user-friendly messages
-        if 'network' in error_str or 'connection' in error_str or 'timeout' in error_str:
-            return "Network error occurred. Please check your internet connection and try again."
-
-        if 'permission' in error_str or 'access denied' in error_str:
-            return "Permission error. Please check that you have write access to the output directory."
-
-        if 'disk' in error_str or 'space' in error_str or 'no space' in error_str:
-            return "Insufficient disk space. Please free up space and try again."
-
-        if 'ffmpeg' in error_str:
-            return "FFmpeg error. Please ensure FFmpeg is properly installed."
-
-        if 'video unavailable' in error_str or 'private video' in error_str:
-            return "Video is unavailable or private. Please check the URL."
-
-        if 'age' in error_str and 'restricted' in error_str:
-            return "Video is age-restricted and cannot be downloaded."
+        for pattern, message in _ERROR_PATTERNS:
+            if pattern.search(error_str):
+                return message
 
         # Generic fallback without system details
-        logger.error(f"Download error: {error}")
+        logger.error("Download error: %s", error)
         return "Download failed. Please check the URL and try again."
 
     def create_base_widgets(self) -> None:
@@ -306,7 +726,9 @@ class BaseYouTubeDownloaderGUI:
         dir_frame: ttk.Frame = ttk.Frame(self.root)
         dir_frame.pack(padx=PADDING_LARGE, pady=PADDING_MEDIUM, fill=tk.X)
 
-        self.dir_label = ttk.Label(dir_frame, text=f"Output: {self.output_dir}")
+        # Bound variable so directory changes are a single Tcl set, not a reconfigure
+        self._dir_var = tk.StringVar(master=dir_frame, value=OUTPUT_LABEL_PREFIX + str(self.output_dir))
+        self.dir_label = ttk.Label(dir_frame, textvariable=self._dir_var)
         self.dir_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         browse_btn: ttk.Button = ttk.Button(dir_frame, text="Browse", command=self.browse_directory)
@@ -323,14 +745,15 @@ class BaseYouTubeDownloaderGUI:
             ValueError: If URL is invalid or fails security checks
         """
         # First sanitize the URL
-        url = self._sanitize_url(url)
+        url, parsed = self._sanitize_url(url)
 
-        # Then validate with validators library
-        if not url or not validators.url(url):
+        # Then validate structure using the parse from sanitization
+        if not parsed.netloc:
             raise ValueError("Please enter a valid YouTube URL")
 
         # Check it's actually a YouTube URL
-        if "youtube.com" not in url and "youtu.be" not in url:
+        host = (parsed.hostname or "").lower()
+        if host not in YOUTUBE_HOSTS and not host.endswith(".youtube.com"):
             raise ValueError("Not a YouTube URL")
 
         logger.info("URL validation successful")
@@ -368,7 +791,7 @@ class BaseYouTubeDownloaderGUI:
         )
         if selected_dir:
             self.output_dir = Path(selected_dir)
-            self.dir_label.config(text=f"Output: {self.output_dir}")
+            self._dir_var.set(OUTPUT_LABEL_PREFIX + selected_dir)
             # Save the preference (to be overridden by subclasses for specific dir types)
             self.save_directory_preference(selected_dir)
 
@@ -384,21 +807,161 @@ class BaseYouTubeDownloaderGUI:
         """
         pass
 
+    def _on_close(self) -> None:
+        """Write pending preferences, then destroy the window."""
+        try:
+            self.user_config.close()
+        finally:
+            self.root.destroy()
+
+    def _reset_buttons(self) -> None:
+        """Re-enable the download button and disable cancel after a download ends."""
+        self.download_btn.config(state='normal')
+        if hasattr(self, 'cancel_btn'):
+            self.cancel_btn.config(state='disabled')
+
     def cancel_download(self) -> None:
         """Cancel the ongoing download.
 
-        Sets the cancellation flag to stop the current download operation.
-        The download worker thread checks this flag and stops gracefully.
+        Cancels the coordinating asyncio task and sets the cancellation
+        flag. The progress hook installed by _start_download raises
+        DownloadCancelled inside yt-dlp's blocking read once the flag is set.
 
         Displays an informational message to the user confirming the
-        cancellation request. Note that due to yt-dlp's architecture,
-        the cancellation may not be immediate.
+        cancellation request.
         """
-        if self.download_thread and self.download_thread.is_alive():
+        if self._download_future is not None and not self._download_future.done():
             self.cancel_flag.set()
+            self._download_future.cancel()
             messagebox.showinfo("Canceling", "Download cancellation requested...")
-            # Note: yt-dlp doesn't have built-in cancellation, but the flag
-            # prevents success message and can be checked by progress hooks
+
+    def _post_ui(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Queue a UI update from a worker thread.
+
+        Updates are applied together by a single root.after callback, which is
+        only scheduled when none is already pending, so a burst of progress
+        hooks costs one Tk round-trip instead of one per event.
+
+        Args:
+            func: Callable to run on the main thread
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        """
+        self._ui_queue.put((func, args, kwargs))
+        with self._ui_lock:
+            if self._ui_drain_pending:
+                return
+            self._ui_drain_pending = True
+        self.root.after(UI_DRAIN_DELAY_MS, self._drain_ui_queue)
+
+    def _drain_ui_queue(self) -> None:
+        """Apply all queued UI updates on the main thread."""
+        # Clear the flag first so updates posted while draining schedule a new drain
+        with self._ui_lock:
+            self._ui_drain_pending = False
+        while True:
+            try:
+                func, args, kwargs = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                logger.error("UI update failed", exc_info=True)
+
+    def _cancel_hook(self, d: dict[str, Any]) -> None:
+        """Abort the running yt-dlp download once cancellation is requested."""
+        if self.cancel_flag.is_set():
+            from yt_dlp.utils import DownloadCancelled
+
+            raise DownloadCancelled()
+
+    def _get_output_template(self) -> dict[str, str]:
+        """
+        Return the yt-dlp output template for the current output directory.
+
+        Security: only the filename portion comes from the template, so video
+        metadata can't introduce path components. The template is rebuilt
+        only when output_dir changes.
+
+        Returns:
+            outtmpl mapping for yt-dlp
+        """
+        cached = self._output_template
+        if cached is None or cached[0] != self.output_dir:
+            cached = (self.output_dir, {'default': str(self.output_dir / SAFE_OUTPUT_TEMPLATE)})
+            self._output_template = cached
+        return cached[1]
+
+    def _start_download(self, url: str, ydl_opts: dict[str, Any]) -> None:
+        """
+        Schedule a download on the background asyncio loop.
+
+        The loop and its single-thread executor are created on first use
+        and reused for every subsequent download, so repeated downloads
+        don't pay thread startup and keep the shared YoutubeDL instances warm.
+
+        Args:
+            url: URL to download
+            ydl_opts: yt-dlp options dictionary
+        """
+        ydl_opts.setdefault('progress_hooks', []).append(self._cancel_hook)
+
+        # Clear before scheduling so a cancel issued before the worker starts is kept
+        self.cancel_flag.clear()
+
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(
+                concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="download",
+                    initializer=_lower_worker_priority
+                )
+            )
+            self.download_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+            self.download_thread.start()
+
+        self._download_future = asyncio.run_coroutine_threadsafe(
+            self._download_coro(url, ydl_opts), self._loop
+        )
+
+    async def _download_coro(self, url: str, ydl_opts: dict[str, Any]) -> None:
+        """
+        Run download_worker in the executor.
+
+        The executor job is shielded so cancelling this task never drops a
+        queued job; download_worker always runs and resets the UI itself.
+
+        Args:
+            url: URL to download
+            ydl_opts: yt-dlp options dictionary
+        """
+        loop = asyncio.get_running_loop()
+        await asyncio.shield(loop.run_in_executor(None, self.download_worker, url, ydl_opts))
+
+    def _run_download(self, ydl: "yt_dlp.YoutubeDL", url: str) -> None:
+        """
+        Download url, reusing extracted info when the subclass sets _reuse_info.
+
+        Both paths return yt-dlp's retcode, which is non-zero when yt-dlp
+        reported an error without raising; that is turned into an exception
+        so the retry logic sees it.
+
+        Args:
+            ydl: YoutubeDL instance to download with
+            url: Validated URL
+
+        Raises:
+            RuntimeError: If yt-dlp reports a failed download
+        """
+        if self._reuse_info:
+            retcode = _download_with_info(ydl, _extract_info_cached(ydl, url))
+        else:
+            retcode = ydl.download([url])
+        if retcode:
+            raise RuntimeError(f"yt-dlp reported a failed download (exit code {retcode})")
 
     def download_worker(self, url: str, ydl_opts: dict[str, Any]) -> None:
         """
@@ -412,9 +975,6 @@ class BaseYouTubeDownloaderGUI:
         last_error = None
 
         try:
-            # Clear cancel flag at start
-            self.cancel_flag.clear()
-
             # Security: Validate and sanitize URL
             self.validate_url(url)
 
@@ -431,14 +991,9 @@ class BaseYouTubeDownloaderGUI:
             ffmpeg_path: str = self.config.get_ffmpeg_path()
             self._validate_ffmpeg_path(ffmpeg_path)
 
-            # Security: Sanitize output template to prevent path traversal
-            # Use only filename portion, discard any path components
-            safe_template = '%(title).200s.%(ext)s'  # Limit title length
-            output_template = str(self.output_dir / safe_template)
-
             # Add security options to yt-dlp
             ydl_opts['ffmpeg_location'] = ffmpeg_path
-            ydl_opts['outtmpl'] = output_template
+            ydl_opts['outtmpl'] = self._get_output_template()
 
             # Security: Set socket timeout to prevent hanging
             if 'socket_timeout' not in ydl_opts:
@@ -448,18 +1003,24 @@ class BaseYouTubeDownloaderGUI:
             if 'max_filesize' not in ydl_opts:
                 ydl_opts['max_filesize'] = 10 * 1024 * 1024 * 1024
 
-            # Retry logic with exponential backoff
-            while retry_count < MAX_RETRIES:
-                try:
-                    # Check if download was canceled
-                    if self.cancel_flag.is_set():
-                        logger.info("Download canceled by user")
-                        break
+            # Hooks are bound to this GUI, so they are registered per download
+            # rather than baked into the shared instance's cache key
+            progress_hooks = ydl_opts.pop('progress_hooks', [])
+            opts_key = _freeze(ydl_opts)
 
-                    logger.info(f"Download attempt {retry_count + 1}/{MAX_RETRIES}")
+            # Retry logic with exponential backoff. A cancel during a download is
+            # raised by the progress hook, and one during backoff ends the wait early.
+            while retry_count < MAX_RETRIES and not self.cancel_flag.is_set():
+                try:
+                    logger.info("Download attempt %d/%d", retry_count + 1, MAX_RETRIES)
 
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        ydl.download([url])
+                    entry = _checkout_ydl(opts_key)
+                    ydl, relay = entry
+                    relay.hooks = progress_hooks
+                    try:
+                        self._run_download(ydl, url)
+                    finally:
+                        _checkin_ydl(opts_key, entry)
 
                     # Success - break retry loop
                     logger.info("Download completed successfully")
@@ -468,55 +1029,44 @@ class BaseYouTubeDownloaderGUI:
                 except Exception as e:
                     last_error = e
                     retry_count += 1
-                    error_str = str(e).lower()
+                    # Cached info may hold expired stream URLs; extract afresh next time
+                    _info_cache.pop(_info_cache_key(url), None)
+
+                    if self.cancel_flag.is_set():
+                        logger.info("Download canceled by user")
+                        break
 
                     # Don't retry on certain errors
-                    non_retryable = [
-                        'video unavailable',
-                        'private video',
-                        'age-restricted',
-                        'invalid url',
-                        'not a youtube url',
-                        'permission denied',
-                        'disk space'
-                    ]
-
-                    if any(err in error_str for err in non_retryable):
-                        logger.warning(f"Non-retryable error: {e}")
+                    if NON_RETRYABLE_ERRORS.search(str(e)):
+                        logger.warning("Non-retryable error: %s", e)
                         raise
 
                     if retry_count < MAX_RETRIES:
                         # Exponential backoff: 2s, 4s, 8s
                         delay = INITIAL_RETRY_DELAY * (2 ** (retry_count - 1))
-                        logger.info(f"Retrying in {delay} seconds...")
-                        time.sleep(delay)
+                        logger.info("Retrying in %d seconds...", delay)
+                        if self.cancel_flag.wait(timeout=delay):
+                            logger.info("Download canceled during retry backoff")
+                            break
                     else:
-                        logger.error(f"Max retries reached: {e}")
+                        logger.error("Max retries reached: %s", e)
                         raise
 
             # Only show success if not canceled and download succeeded
             if not self.cancel_flag.is_set() and retry_count < MAX_RETRIES:
-                self.root.after(0, lambda: messagebox.showinfo(
-                    "Success",
-                    "Download completed successfully!"
-                ))
+                self._post_ui(messagebox.showinfo, "Success", "Download completed successfully!")
             elif self.cancel_flag.is_set():
-                self.root.after(0, lambda: messagebox.showinfo(
-                    "Canceled",
-                    "Download was canceled."
-                ))
+                self._post_ui(messagebox.showinfo, "Canceled", "Download was canceled.")
 
         except Exception as e:
             # Security: Sanitize error messages to avoid exposing system details
             error_msg = self._sanitize_generic_error(e)
 
             if not self.cancel_flag.is_set():
-                self.root.after(0, lambda msg=error_msg: messagebox.showerror("Error", msg))
+                self._post_ui(messagebox.showerror, "Error", error_msg)
 
             # Log the actual error for debugging (not shown to user)
-            logger.error(f"Download failed: {e}", exc_info=True)
+            logger.error("Download failed: %s", e, exc_info=True)
 
         finally:
-            self.root.after(0, lambda: self.download_btn.config(state='normal'))
-            if hasattr(self, 'cancel_btn'):
-                self.root.after(0, lambda: self.cancel_btn.config(state='disabled'))
+            self._post_ui(self._reset_buttons)
@@ -1,21 +1,85 @@
 """Configuration management for YouTube Downloader."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import functools
 import os
 import platform
 import shutil
 import stat
 import logging
 import tempfile
-from typing import Optional
+from typing import Final, Literal, Optional
 
-# Configure logging for security events
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Platform detected once at import; see _refresh_platform()
+_SYSTEM: str = platform.system()
+_IS_WINDOWS: bool = _SYSTEM == "Windows"
+_IS_DARWIN: bool = _SYSTEM == "Darwin"
+
+
+def _refresh_platform() -> None:
+    """Re-detect the platform, e.g. after tests patch platform.system().
+
+    FFmpeg lookups are platform-specific, so they are dropped when the
+    detected platform changes.
+    """
+    global _SYSTEM, _IS_WINDOWS, _IS_DARWIN, _ffmpeg_path
+    system = platform.system()
+    if system != _SYSTEM:
+        _ffmpeg_path = None
+        _validated_ffmpeg.clear()
+    _SYSTEM = system
+    _IS_WINDOWS = _SYSTEM == "Windows"
+    _IS_DARWIN = _SYSTEM == "Darwin"
+
+
+# Primary (music, video) directory names under home, per platform
+_MEDIA_DIR_NAMES = {
+    "Windows": ("Music", "Videos"),
+    "Darwin": ("Music", "Movies"),
+}
+_DEFAULT_MEDIA_DIR_NAMES = ("Music", "Videos")  # Linux and others
+
+# Per media kind: (Downloads subfolder, youtube_downloads subfolder, temp dir name)
+_DIR_SPECS: dict[str, tuple[str, str, str]] = {
+    "music": ("Music", "music", "youtube_music"),
+    "video": ("Videos", "videos", "youtube_videos"),
+}
+
+# FFmpeg candidates in search order; bare names are looked up on PATH
+_FFMPEG_CANDIDATES_WIN: Final[tuple[str, ...]] = (
+    "./ffmpeg/ffmpeg-master-latest-win64-gpl/bin/ffmpeg.exe",  # Local installation
+    "ffmpeg.exe",
+    "C:/ffmpeg/bin/ffmpeg.exe",
+    "C:/Program Files/ffmpeg/bin/ffmpeg.exe",
+)
+_FFMPEG_CANDIDATES_UNIX: Final[tuple[str, ...]] = (
+    "ffmpeg",
+    "/usr/bin/ffmpeg",
+    "/usr/local/bin/ffmpeg",
+    "/opt/homebrew/bin/ffmpeg",  # macOS Homebrew on Apple Silicon
+    "/usr/local/opt/ffmpeg/bin/ffmpeg",  # macOS Homebrew on Intel
+)
+
+# FFmpeg lookups shared by every Config in the process; _refresh_platform()
+# drops them when the platform changes. Only successful lookups are kept, so
+# FFmpeg installed mid-session is still found.
+_ffmpeg_path: Optional[str] = None
+# Validated executables with the (inode, mtime, mode) they had when checked,
+# so a replaced or chmod'ed file is validated again
+_validated_ffmpeg: dict[str, tuple[str, tuple[int, int, int]]] = {}
+
+
+def _file_signature(path: str) -> Optional[tuple[int, int, int]]:
+    """Return (inode, mtime_ns, mode) for path, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_mode)
+
 
 class Config:
     """Configuration class for managing user-specific settings.
@@ -28,23 +92,73 @@ class Config:
     multiple common installation locations.
 
     Attributes:
-        platform: String identifier for the current OS (Windows, Darwin, Linux).
+        platform: String identifier for the current OS (Windows, Darwin, Linux),
+            as detected when the instance was created. Platform-specific
+            branches and the FFmpeg caches read the module-level detection.
+
+    FFmpeg lookups are cached per process: the resolved path is found once,
+    and paths that validate successfully are not re-checked on later downloads.
+    Call invalidate_ffmpeg_cache() to force a fresh search.
     """
 
     def __init__(self) -> None:
         """Initialize the configuration manager.
 
-        Detects the current platform/operating system for platform-specific
+        Uses the platform detected at import for platform-specific
         configuration decisions.
         """
-        self.platform: str = platform.system()
-
-    def _validate_directory(self, directory: Path) -> Optional[Path]:
+        self.platform: str = _SYSTEM
+        self._home: Path = Path.home()
+        music_name, video_name = _MEDIA_DIR_NAMES.get(_SYSTEM, _DEFAULT_MEDIA_DIR_NAMES)
+        self._primary_dirs: dict[str, Path] = {
+            "music": self._home / music_name,
+            "video": self._home / video_name,
+        }
+        # Validated default directory per media kind, filled on first lookup
+        self._dir_cache: dict[str, Path] = {}
+
+    @functools.cached_property
+    def _cwd(self) -> Path:
+        """Working directory at first use."""
+        return Path.cwd()
+
+    @functools.cached_property
+    def _tmp(self) -> Path:
+        """System temporary directory."""
+        return Path(tempfile.gettempdir())
+
+    @functools.cached_property
+    def _allowed_root_prefixes(self) -> tuple[str, ...]:
+        """Separator-terminated home, temp and cwd paths for prefix checks."""
+        return tuple(
+            os.path.normcase(os.fspath(p)).rstrip(os.sep) + os.sep
+            for p in (self._home, self._tmp, self._cwd)
+        )
+
+    @functools.cached_property
+    def _fallback_dirs(self) -> dict[str, tuple[Path, ...]]:
+        """Directories tried, in order, when a primary media directory fails."""
+        return {
+            kind: (
+                self._home / "Downloads" / downloads_sub,
+                self._home / "youtube_downloads" / custom_sub,
+                self._cwd / "downloads" / custom_sub,
+            )
+            for kind, (downloads_sub, custom_sub, _) in _DIR_SPECS.items()
+        }
+
+    def _validate_directory(
+        self, directory: Path, *, create: bool = True, trusted: bool = False
+    ) -> Optional[Path]:
         """
         Validate that a directory exists and is writable.
 
         Args:
             directory: Path object to validate
+            create: Whether to create the directory if it does not exist
+            trusted: Skip the allowed-location check. Only for the platform's
+                built-in media directories under home; fallbacks derived
+                from cwd or the environment keep the check
 
         Returns:
             Path object if valid and writable, None otherwise
@@ -54,51 +168,51 @@ class Config:
             resolved_path = directory.resolve()
 
             # Security check: ensure resolved path is not outside expected areas
-            # This prevents path traversal attacks
+            # (home, temp or cwd). This prevents path traversal attacks
+            if not trusted:
+                path_prefix = os.path.normcase(os.fspath(resolved_path)) + os.sep
+                if not path_prefix.startswith(self._allowed_root_prefixes):
+                    logger.warning("Directory path outside allowed locations: %s", resolved_path)
+                    return None
+
+            # One lstat covers existence, type and symlink-ness
+            created_now = False
             try:
-                resolved_path.relative_to(Path.home())
-            except ValueError:
-                # Not under home directory, check if under temp or cwd
-                try:
-                    resolved_path.relative_to(Path(tempfile.gettempdir()))
-                except ValueError:
-                    try:
-                        resolved_path.relative_to(Path.cwd())
-                    except ValueError:
-                        logger.warning(f"Directory path outside allowed locations: {resolved_path}")
-                        return None
-
-            # Check if path exists
-            if not resolved_path.exists():
-                logger.info(f"Directory does not exist, attempting to create: {resolved_path}")
+                st = os.lstat(resolved_path)
+            except FileNotFoundError:
+                if not create:
+                    return None
+                logger.info("Directory does not exist, attempting to create: %s", resolved_path)
                 try:
                     resolved_path.mkdir(parents=True, exist_ok=True)
                     # Set secure permissions (owner read/write/execute only)
-                    if self.platform != "Windows":
+                    if not _IS_WINDOWS:
                         resolved_path.chmod(stat.S_IRWXU)
+                    created_now = True
                 except Exception as e:
-                    logger.warning(f"Failed to create directory {resolved_path}: {e}")
+                    logger.warning("Failed to create directory %s: %s", resolved_path, e)
+                    return None
+            else:
+                # resolve() already followed links, so one here means the path
+                # was swapped after resolution
+                if stat.S_ISLNK(st.st_mode):
+                    logger.warning("Directory became a symlink during validation: %s", resolved_path)
+                    return None
+                # Verify it's actually a directory
+                if not stat.S_ISDIR(st.st_mode):
+                    logger.warning("Path exists but is not a directory: %s", resolved_path)
                     return None
 
-            # Verify it's actually a directory
-            if not resolved_path.is_dir():
-                logger.warning(f"Path exists but is not a directory: {resolved_path}")
-                return None
-
-            # Check if writable by attempting to create a test file
-            test_file = resolved_path / ".write_test"
-            try:
-                test_file.touch()
-                test_file.unlink()
-            except Exception as e:
-                logger.warning(f"Directory is not writable: {resolved_path}: {e}")
+            # Check if writable; a directory we just created is known to be
+            if not created_now and not os.access(resolved_path, os.W_OK):
+                logger.warning("Directory is not writable: %s", resolved_path)
                 return None
 
-            logger.info(f"Directory validated successfully: {resolved_path}")
+            logger.info("Directory validated successfully: %s", resolved_path)
             return resolved_path
 
         except Exception as e:
-            logger.error(f"Error validating directory {directory}: {e}")
+            logger.error("Error validating directory %s: %s", directory, e)
             return None
 
     def get_default_music_dir(self) -> Path:
@@ -115,36 +229,7 @@ class Config:
         Returns:
             Path object for a validated, writable music directory.
         """
-        # Primary directories based on OS
-        if self.platform == "Windows":
-            primary_dir = Path.home() / "Music"
-        elif self.platform == "Darwin":  # macOS
-            primary_dir = Path.home() / "Music"
-        else:  # Linux and others
-            primary_dir = Path.home() / "Music"
-
-        # Try primary directory
-        validated_dir = self._validate_directory(primary_dir)
-        if validated_dir:
-            return validated_dir
-
-        # Fallback options
-        fallback_dirs = [
-            Path.home() / "Downloads" / "Music",
-            Path.home() / "youtube_downloads" / "music",
-            Path.cwd() / "downloads" / "music"
-        ]
-
-        for fallback in fallback_dirs:
-            logger.info(f"Trying fallback directory: {fallback}")
-            validated_dir = self._validate_directory(fallback)
-            if validated_dir:
-                return validated_dir
-
-        # Last resort: use temp directory
-        temp_dir = Path(tempfile.gettempdir()) / "youtube_music"
-        logger.warning(f"All fallbacks failed, using temporary directory: {temp_dir}")
-        return self._validate_directory(temp_dir) or temp_dir
+        return self._get_default_dir("music")
 
     def get_default_video_dir(self) -> Path:
         """Get the default video directory based on the operating system.
@@ -160,36 +245,64 @@ class Config:
         Returns:
             Path object for a validated, writable video directory.
         """
-        # Primary directories based on OS
-        if self.platform == "Windows":
-            primary_dir = Path.home() / "Videos"
-        elif self.platform == "Darwin":  # macOS
-            primary_dir = Path.home() / "Movies"
-        else:  # Linux and others
-            primary_dir = Path.home() / "Videos"
-
-        # Try primary directory
-        validated_dir = self._validate_directory(primary_dir)
+        return self._get_default_dir("video")
+
+    def _get_default_dir(self, kind: Literal["music", "video"]) -> Path:
+        """
+        Find a writable directory for the given media kind.
+
+        Args:
+            kind: "music" or "video"
+
+        Returns:
+            Path object for a validated, writable directory.
+        """
+        cached = self._dir_cache.get(kind)
+        if cached is not None:
+            return cached
+
+        validated_dir = self._find_default_dir(kind)
         if validated_dir:
+            self._dir_cache[kind] = validated_dir
             return validated_dir
 
-        # Fallback options
-        fallback_dirs = [
-            Path.home() / "Downloads" / "Videos",
-            Path.home() / "youtube_downloads" / "videos",
-            Path.cwd() / "downloads" / "videos"
-        ]
+        # Last resort: use temp directory (not cached, so later calls retry)
+        temp_dir = self._tmp / _DIR_SPECS[kind][2]
+        logger.warning("All fallbacks failed, using temporary directory: %s", temp_dir)
+        return self._validate_directory(temp_dir) or temp_dir
 
-        for fallback in fallback_dirs:
-            logger.info(f"Trying fallback directory: {fallback}")
-            validated_dir = self._validate_directory(fallback)
+    def _find_default_dir(self, kind: Literal["music", "video"]) -> Optional[Path]:
+        """
+        Validate the primary directory for a media kind, then its fallbacks.
+
+        Args:
+            kind: "music" or "video"
+
+        Returns:
+            First writable candidate, or None if all fail
+        """
+        # Try primary directory (chosen per platform in __init__); it is a
+        # fixed name under home, so the allowed-location check is skipped
+        validated_dir = self._validate_directory(self._primary_dirs[kind], trusted=True)
+        if validated_dir:
+            return validated_dir
+
+        # Probe the fallbacks concurrently without creating anything, then walk
+        # them in priority order so an earlier fallback still wins by being created
+        fallbacks = self._fallback_dirs[kind]
+        with ThreadPoolExecutor(max_workers=len(fallbacks)) as pool:
+            probed = list(pool.map(lambda d: self._validate_directory(d, create=False), fallbacks))
+
+        for fallback, existing in zip(fallbacks, probed):
+            logger.info("Trying fallback directory: %s", fallback)
+            validated_dir = existing or self._validate_directory(fallback)
             if validated_dir:
                 return validated_dir
+        return None
 
-        # Last resort: use temp directory
-        temp_dir = Path(tempfile.gettempdir()) / "youtube_videos"
-        logger.warning(f"All fallbacks failed, using temporary directory: {temp_dir}")
-        return self._validate_directory(temp_dir) or temp_dir
+    def invalidate_dir_cache(self) -> None:
+        """Forget validated default directories so the next lookup re-checks them."""
+        self._dir_cache.clear()
 
     def validate_ffmpeg_executable(self, ffmpeg_path: str) -> Optional[str]:
         """
@@ -201,48 +314,62 @@ class Config:
         Returns:
             Validated path as string if valid, None otherwise
         """
-        try:
-            # Try to find in PATH first
-            which_result = shutil.which(ffmpeg_path)
-            if which_result:
-                path_obj = Path(which_result).resolve()
-
-                # Verify it's a file
-                if not path_obj.is_file():
-                    logger.warning(f"FFmpeg path is not a file: {path_obj}")
-                    return None
-
-                # Check if executable
-                if not os.access(path_obj, os.X_OK):
-                    logger.warning(f"FFmpeg file is not executable: {path_obj}")
-                    return None
+        # Only successes are cached so a newly installed FFmpeg is still picked up.
+        # A hit costs one stat to confirm the file hasn't changed since.
+        hit = _validated_ffmpeg.get(ffmpeg_path)
+        if hit is not None:
+            if _file_signature(hit[0]) == hit[1]:
+                return hit[0]
+            del _validated_ffmpeg[ffmpeg_path]
+
+        validated = self._check_ffmpeg_executable(ffmpeg_path)
+        if validated:
+            signature = _file_signature(validated)
+            if signature is not None:
+                # The resolved path validates to itself, so cache it under both
+                _validated_ffmpeg[ffmpeg_path] = _validated_ffmpeg[validated] = (validated, signature)
+        return validated
+
+    def _check_ffmpeg_executable(self, ffmpeg_path: str) -> Optional[str]:
+        """
+        Run the filesystem checks behind validate_ffmpeg_executable.
 
-                logger.info(f"FFmpeg validated in PATH: {path_obj}")
-                return str(path_obj)
+        Args:
+            ffmpeg_path: String or Path to FFmpeg executable
 
-            # If not in PATH, try direct path
-            path_obj = Path(ffmpeg_path).resolve()
+        Returns:
+            Validated path as string if valid, None otherwise
+        """
+        try:
+            # Absolute paths are checked directly; only bare names need a PATH search
+            which_result = None if os.path.isabs(ffmpeg_path) else shutil.which(ffmpeg_path)
+            path_obj = Path(which_result or ffmpeg_path).resolve()
 
-            # Check if file exists
-            if not path_obj.exists():
-                logger.warning(f"FFmpeg not found at path: {path_obj}")
+            # One stat covers existence and file type
+            try:
+                st = os.stat(path_obj)
+            except FileNotFoundError:
+                logger.warning("FFmpeg not found at path: %s", path_obj)
                 return None
 
             # Verify it's a file
-            if not path_obj.is_file():
-                logger.warning(f"FFmpeg path is not a file: {path_obj}")
+            if not stat.S_ISREG(st.st_mode):
+                logger.warning("FFmpeg path is not a file: %s", path_obj)
                 return None
 
             # Check if executable (on Unix-like systems)
-            if self.platform != "Windows" and not os.access(path_obj, os.X_OK):
-                logger.warning(f"FFmpeg file is not executable: {path_obj}")
+            if not _IS_WINDOWS and not st.st_mode & 0o111:
+                logger.warning("FFmpeg file is not executable: %s", path_obj)
                 return None
 
-            logger.info(f"FFmpeg validated at direct path: {path_obj}")
+            if which_result:
+                logger.info("FFmpeg validated in PATH: %s", path_obj)
+            else:
+                logger.info("FFmpeg validated at direct path: %s", path_obj)
             return str(path_obj)
 
         except Exception as e:
-            logger.error(f"Error validating FFmpeg path {ffmpeg_path}: {e}")
+            logger.error("Error validating FFmpeg path %s: %s", ffmpeg_path, e)
             return None
 
     def get_ffmpeg_path(self) -> str:
@@ -259,45 +386,38 @@ class Config:
             String path to validated FFmpeg executable, or default name
             if not found (validation will occur at usage time).
         """
-        if self.platform == "Windows":
-            # Try local installation first
-            local_path = Path("./ffmpeg/ffmpeg-master-latest-win64-gpl/bin/ffmpeg.exe")
-            validated = self.validate_ffmpeg_executable(str(local_path))
-            if validated:
-                return validated
-
-            # Try PATH
-            validated = self.validate_ffmpeg_executable("ffmpeg.exe")
-            if validated:
-                return validated
-
-            # Try common installation locations
-            common_paths = [
-                Path("C:/ffmpeg/bin/ffmpeg.exe"),
-                Path("C:/Program Files/ffmpeg/bin/ffmpeg.exe"),
-            ]
-            for path in common_paths:
-                validated = self.validate_ffmpeg_executable(str(path))
-                if validated:
-                    return validated
-        else:
-            # On Linux/Mac, check PATH first
-            validated = self.validate_ffmpeg_executable("ffmpeg")
-            if validated:
-                return validated
-
-            # Try common installation locations
-            common_paths = [
-                Path("/usr/bin/ffmpeg"),
-                Path("/usr/local/bin/ffmpeg"),
-                Path("/opt/homebrew/bin/ffmpeg"),  # macOS Homebrew on Apple Silicon
-                Path("/usr/local/Cellar/ffmpeg"),   # macOS Homebrew
-            ]
-            for path in common_paths:
-                validated = self.validate_ffmpeg_executable(str(path))
-                if validated:
-                    return validated
-
-        # Return default and let validation happen at usage time
-        logger.warning("FFmpeg not found in standard locations")
-        return "ffmpeg" if self.platform != "Windows" else "ffmpeg.exe"
+        global _ffmpeg_path
+        if _ffmpeg_path is not None:
+            # Revalidated (one stat on a cache hit) so a removed or replaced
+            # binary triggers a fresh search instead of being handed out
+            if self.validate_ffmpeg_executable(_ffmpeg_path) == _ffmpeg_path:
+                return _ffmpeg_path
+            _ffmpeg_path = None
+
+        path = self._find_ffmpeg_path()
+        if path is None:
+            # Return default and let validation happen at usage time; not
+            # cached, so a later call searches again
+            logger.warning("FFmpeg not found in standard locations")
+            return "ffmpeg.exe" if _IS_WINDOWS else "ffmpeg"
+        _ffmpeg_path = path
+        return path
+
+    def invalidate_ffmpeg_cache(self) -> None:
+        """Forget cached FFmpeg lookups so the next call searches again."""
+        global _ffmpeg_path
+        _ffmpeg_path = None
+        _validated_ffmpeg.clear()
+
+    def _find_ffmpeg_path(self) -> Optional[str]:
+        """
+        Search the platform's candidate locations for FFmpeg.
+
+        Returns:
+            String path to validated FFmpeg executable, or None if not found.
+        """
+        candidates = _FFMPEG_CANDIDATES_WIN if _IS_WINDOWS else _FFMPEG_CANDIDATES_UNIX
+        return next(
+            (v for p in candidates if (v := self.validate_ffmpeg_executable(p)) is not None),
+            None,
+        )
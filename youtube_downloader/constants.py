@@ -1,6 +1,8 @@
 """Constants for YouTube Downloader application."""
 
-from typing import Final
+import sys
+from types import MappingProxyType
+from typing import Final, Mapping
 
 # Window dimensions
 WINDOW_WIDTH: Final[int] = 600
@@ -15,34 +17,45 @@ FG_COLOR: Final[str] = "#ffffff"
 FG_COLOR_DARK: Final[str] = "#000000"
 HIGHLIGHT_COLOR: Final[str] = "#404040"
 SELECT_BG_COLOR: Final[str] = "#ff0000"
+ERROR_FG_COLOR: Final[str] = "#ff0000"
+DARK_THEME_NAME: Final[str] = "youtube_downloader_dark"
 
 # Padding values
 PADDING_LARGE: Final[int] = 10
 PADDING_MEDIUM: Final[int] = 5
 PADDING_SMALL: Final[int] = 2
 
+# Output directory label
+OUTPUT_LABEL_PREFIX: Final[str] = "Output: "
+
+# Inline error message display time
+ERROR_DISPLAY_MS: Final[int] = 4000
+
 # Font configurations
 FONT_DEFAULT: Final[tuple[str, int, str]] = ("TkDefaultFont", 9, "bold")
 FONT_ENTRY: Final[tuple[str, int]] = ("Segoe UI", 10)
 
-# Video quality options
-VIDEO_QUALITIES: Final[dict[str, str]] = {
+# Video quality options (read-only; keys interned so lookups with an
+# interned selection compare by identity)
+VIDEO_QUALITIES: Final[Mapping[str, str]] = MappingProxyType({sys.intern(k): v for k, v in {
     "360p": "bv*[height<=360]+ba/b[height<=360]",
     "480p": "bv*[height<=480]+ba/b[height<=480]",
     "720p": "bv*[height<=720]+ba/b[height<=720]",
     "1080p": "bv*[height<=1080]+ba/b[height<=1080]",
     "1440p (2K)": "bv*[height<=1440]+ba/b[height<=1440]",
     "2160p (4K)": "bv*[height<=2160]+ba/b[height<=2160]",
-}
+}.items()})
+VIDEO_QUALITY_NAMES: Final[tuple[str, ...]] = tuple(VIDEO_QUALITIES)
 
-# Audio format options
-AUDIO_FORMATS: Final[dict[str, dict[str, str]]] = {
+# Audio format options (read-only, interned keys as above)
+AUDIO_FORMATS: Final[Mapping[str, dict[str, str]]] = MappingProxyType({sys.intern(k): v for k, v in {
     "MP3": {"codec": "mp3", "quality": "320"},
     "M4A": {"codec": "m4a", "quality": "320"},
     "FLAC": {"codec": "flac", "quality": "0"},
     "WAV": {"codec": "wav", "quality": "0"},
     "OPUS": {"codec": "opus", "quality": "320"},
-}
+}.items()})
+AUDIO_FORMAT_NAMES: Final[tuple[str, ...]] = tuple(AUDIO_FORMATS)
 
 # Default quality settings
 DEFAULT_VIDEO_QUALITY: Final[str] = "1080p"
@@ -58,3 +71,4 @@ LOG_FORMAT: Final[str] = "%(asctime)s - %(levelname)s - %(message)s"
 
 # Config file
 CONFIG_FILENAME: Final[str] = "yt_downloader_config.json"
+CONFIG_SAVE_DELAY_S: Final[float] = 0.25  # coalesce rapid preference changes
@@ -1,32 +1,63 @@
 """User configuration management with persistent storage."""
 
-from typing import Any, Optional
+from typing import Any, Final, Optional, cast
 import json
+import os
+import tempfile
+import threading
 from pathlib import Path
 
 from .constants import (
     CONFIG_FILENAME,
+    CONFIG_SAVE_DELAY_S,
     DEFAULT_VIDEO_QUALITY,
     DEFAULT_AUDIO_FORMAT
 )
 
+# Resolved once at import; Path.home() consults the environment on every call
+_CONFIG_DIR: Final[Path] = Path.home() / ".youtube_downloader"
+_CONFIG_FILE: Final[Path] = _CONFIG_DIR / CONFIG_FILENAME
+
 
 class UserConfig:
-    """Manages user preferences with JSON persistence."""
+    """Manages user preferences with JSON persistence.
+
+    Changes made through the setters are written after a short delay, so a
+    burst of updates results in a single file write. The delayed write runs
+    on a daemon timer thread that doesn't hold the process open, so owners
+    must call close() when they are done (the GUIs do so when the window is
+    closed) to write any pending change.
+
+    The file is read on first access to the config rather than at construction.
+    """
 
     def __init__(self) -> None:
         """Initialize user config with default values."""
-        self.config_dir: Path = Path.home() / ".youtube_downloader"
-        self.config_file: Path = self.config_dir / CONFIG_FILENAME
-        self.config: dict[str, Any] = {}
-        self.load()
+        self.config_dir: Path = _CONFIG_DIR
+        self.config_file: Path = _CONFIG_FILE
+        self._config: Optional[dict[str, Any]] = None
+        self._lock: threading.Lock = threading.Lock()
+        self._dirty: bool = False
+        self._save_timer: Optional[threading.Timer] = None
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """Configuration values, loaded from disk on first access."""
+        if self._config is None:
+            self.load()
+        return cast(dict[str, Any], self._config)
+
+    @config.setter
+    def config(self, value: dict[str, Any]) -> None:
+        self._config = value
 
     def load(self) -> None:
         """Load configuration from JSON file."""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
+                # json accepts bytes and detects UTF-8 itself, so skip the text layer
+                with open(self.config_file, 'rb') as f:
+                    self.config = json.loads(f.read())
             else:
                 # Initialize with defaults
                 self.config = self._get_defaults()
@@ -36,14 +67,56 @@ class UserConfig:
             self.config = self._get_defaults()
 
     def save(self) -> None:
-        """Save configuration to JSON file."""
+        """Save configuration to JSON file.
+
+        Writes to a temporary file in the same directory and renames it over
+        the config file, so an interrupted save never leaves partial JSON.
+        """
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=self.config_dir, suffix='.tmp', delete=False
+            ) as f:
+                try:
+                    # Compact output; the file is rewritten on every preference change
+                    json.dump(self.config, f, separators=(',', ':'))
+                    f.close()
+                    os.replace(f.name, self.config_file)
+                except BaseException:
+                    # Never leave a partial temp file behind, whatever failed
+                    f.close()
+                    os.unlink(f.name)
+                    raise
         except IOError as e:
             print(f"Error saving config: {e}")
 
+    def _schedule_save(self) -> None:
+        """Mark the config dirty and (re)start the delayed save timer."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(CONFIG_SAVE_DELAY_S, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush(self) -> None:
+        """Write pending changes, if any."""
+        with self._lock:
+            self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self.save()
+
+    def close(self) -> None:
+        """Cancel the delayed save and write pending changes now."""
+        with self._lock:
+            timer = self._save_timer
+        if timer is not None:
+            timer.cancel()
+        self._flush()
+
     def _get_defaults(self) -> dict[str, Any]:
         """Get default configuration values."""
         return {
@@ -59,9 +132,10 @@ class UserConfig:
         return self.config.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        """Set a configuration value and save."""
-        self.config[key] = value
-        self.save()
+        """Set a configuration value and schedule a save."""
+        with self._lock:
+            self.config[key] = value
+        self._schedule_save()
 
     def get_last_video_dir(self) -> Optional[str]:
         """Get the last used video directory."""
@@ -81,7 +155,7 @@ class UserConfig:
 
     def get_video_quality(self) -> str:
         """Get preferred video quality."""
-        return self.config.get('video_quality', DEFAULT_VIDEO_QUALITY)
+        return cast(str, self.config.get('video_quality', DEFAULT_VIDEO_QUALITY))
 
     def set_video_quality(self, quality: str) -> None:
         """Set preferred video quality."""
@@ -89,7 +163,7 @@ class UserConfig:
 
     def get_audio_format(self) -> str:
         """Get preferred audio format."""
-        return self.config.get('audio_format', DEFAULT_AUDIO_FORMAT)
+        return cast(str, self.config.get('audio_format', DEFAULT_AUDIO_FORMAT))
 
     def set_audio_format(self, format_name: str) -> None:
         """Set preferred audio format."""
@@ -102,7 +176,6 @@ class UserConfig:
 
     def set_window_position(self, window_name: str, geometry: str) -> None:
         """Save window position for a specific window."""
-        if 'window_positions' not in self.config:
-            self.config['window_positions'] = {}
-        self.config['window_positions'][window_name] = geometry
-        self.save()
+        with self._lock:
+            self.config.setdefault('window_positions', {})[window_name] = geometry
+        self._schedule_save()
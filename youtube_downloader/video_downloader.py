@@ -1,24 +1,24 @@
 """Video downloader GUI for YouTube."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+import copy
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import logging
-from datetime import datetime
 from pathlib import Path
 import re
+import sys
 
-from .base_gui import BaseYouTubeDownloaderGUI
-from .config import Config
+from .base_gui import (
+    BaseYouTubeDownloaderGUI, _cached_urlparse, _ffmpeg_thread_args, configure_logging
+)
 from .constants import (
     WINDOW_HEIGHT_VIDEO,
     VIDEO_QUALITIES,
+    VIDEO_QUALITY_NAMES,
     DEFAULT_VIDEO_QUALITY,
     CONCURRENT_FRAGMENTS,
-    LOG_DIR,
-    LOG_DATE_FORMAT,
-    LOG_FORMAT,
     PADDING_LARGE,
     PADDING_MEDIUM,
     PADDING_SMALL,
@@ -29,12 +29,23 @@ from .constants import (
 logger = logging.getLogger(__name__)
 
 # Security constants for video downloads
-ALLOWED_VIDEO_FORMATS = {'mp4', 'webm', 'mkv'}
-ALLOWED_VIDEO_CODECS = {'h264', 'vp9', 'av1'}
-ALLOWED_AUDIO_CODECS = {'aac', 'opus', 'vorbis'}
+ALLOWED_VIDEO_FORMATS = frozenset({'mp4', 'webm', 'mkv'})
+ALLOWED_VIDEO_CODECS = frozenset({'h264', 'vp9', 'av1'})
+ALLOWED_AUDIO_CODECS = frozenset({'aac', 'opus', 'vorbis'})
+ALLOWED_POSTPROCESSOR_ARGS = frozenset({
+    '-c:v', '-c:a', 'copy', '-preset', 'fast', 'medium', 'slow',
+    '-crf', '18', '20', '22', '23', '24', '-b:v', '-b:a', '-vf', '-af', '-threads',
+})
 MAX_CONCURRENT_FRAGMENTS = 10  # Limit concurrent downloads to prevent resource exhaustion
 MAX_VIDEO_HEIGHT = 4320  # 8K max
 
+_GEOMETRY = f"{WINDOW_WIDTH}x{WINDOW_HEIGHT_VIDEO}"
+_NUMERIC_ARG_RE = re.compile(r'^\d+[kKmM]?$')
+_INV_MIB = 1.0 / (1024 * 1024)  # bytes -> MiB as a multiply in the progress hook
+# Bound str.format methods for the progress hook's status text
+_STATUS_FMT = 'Downloading: {:.1f}% (Speed: {:.1f} MB/s, ETA: {}s)'.format
+_PROGRESS_FMT = 'Downloading: {:.1f}%'.format
+
 
 class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
     """GUI application for downloading YouTube videos.
@@ -53,10 +64,14 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
         progress_var: Variable for progress bar percentage.
         progress_bar: Progress bar widget for download progress.
         status_label: Label displaying download status and statistics.
-        quality_var: Variable holding selected video quality.
+        quality_combo: Read-only dropdown holding the selected video quality.
         cancel_btn: Button to cancel ongoing downloads.
     """
 
+    # Downloads are single videos, so extracted info can be reused when the
+    # same video is fetched again at another quality
+    _reuse_info = True
+
     def __init__(self, root: tk.Tk) -> None:
         """Initialize the video downloader GUI.
 
@@ -66,23 +81,24 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
         Args:
             root: The main tkinter window instance.
         """
-        config: Config = Config()
-        # Load last used directory or default
-        output_dir = config.get_default_video_dir()
-        super().__init__(root, "YouTube Video Downloader", output_dir)
-
-        # Check for saved directory preference
-        saved_dir = self.user_config.get_last_video_dir()
-        if saved_dir:
-            self.output_dir = Path(saved_dir)
+        # Output directory comes from _default_output_dir once the base
+        # has loaded the configs
+        super().__init__(root, "YouTube Video Downloader")
 
         # Instance variables
         self.progress_var: tk.DoubleVar
         self.progress_bar: ttk.Progressbar
         self.status_label: ttk.Label
-        self.quality_var: tk.StringVar
+        self.quality_combo: ttk.Combobox
         self.cancel_btn: ttk.Button
 
+        # Latest progress from the worker; only the newest value is drawn
+        self._pending_progress: Optional[tuple[float, str]] = None
+        self._progress_lock: threading.Lock = threading.Lock()
+
+        # Sanitized download options keyed on selected quality
+        self._opts_cache: dict[str, dict[str, Any]] = {}
+
         self.setup_logging()
         self.create_widgets()
 
@@ -94,15 +110,26 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
         the date format YYYYMMDD.
 
         Log files include INFO level messages and above, with timestamps
-        and detailed formatting for troubleshooting.
+        and detailed formatting for troubleshooting. Delegates to
+        configure_logging(), so only the first call in a process sets up
+        the handlers.
         """
-        log_dir: Path = Path(LOG_DIR)
-        log_dir.mkdir(exist_ok=True)
-        logging.basicConfig(
-            filename=log_dir / f"downloader_{datetime.now():{LOG_DATE_FORMAT}}.log",
-            level=logging.INFO,
-            format=LOG_FORMAT
-        )
+        configure_logging()
+
+    def _default_output_dir(self) -> Path:
+        """
+        Return the saved video directory, or the platform default if none is saved.
+
+        The default directory is only looked up (and validated on disk) when
+        there is no saved preference.
+
+        Returns:
+            Starting output directory
+        """
+        saved_dir = self.user_config.get_last_video_dir()
+        if saved_dir:
+            return Path(saved_dir)
+        return self.config.get_default_video_dir()
 
     def create_widgets(self) -> None:
         """Create all widgets for the video downloader.
@@ -124,19 +151,22 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
 
         ttk.Label(quality_frame, text="Quality:").pack(side=tk.LEFT)
 
-        # Get saved quality preference or use default
-        saved_quality = self.user_config.get_video_quality()
-        self.quality_var = tk.StringVar(value=saved_quality)
-
-        quality_combo = ttk.Combobox(
+        self.quality_combo = ttk.Combobox(
             quality_frame,
-            textvariable=self.quality_var,
-            values=list(VIDEO_QUALITIES.keys()),
+            values=VIDEO_QUALITY_NAMES,
             state='readonly',
             width=15
         )
-        quality_combo.pack(side=tk.LEFT, padx=(PADDING_MEDIUM, 0))
-        quality_combo.bind('<<ComboboxSelected>>', self.on_quality_change)
+
+        # Select saved quality preference or use default; the widget holds the
+        # value itself, so no Tcl variable is needed
+        saved_quality = self.user_config.get_video_quality()
+        if saved_quality not in VIDEO_QUALITIES:
+            saved_quality = DEFAULT_VIDEO_QUALITY
+        self.quality_combo.current(VIDEO_QUALITY_NAMES.index(saved_quality))
+
+        self.quality_combo.pack(side=tk.LEFT, padx=(PADDING_MEDIUM, 0))
+        self.quality_combo.bind('<<ComboboxSelected>>', self.on_quality_change)
 
         # Progress Bar
         progress_frame: ttk.Frame = ttk.Frame(self.root)
@@ -164,7 +194,7 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
         self.cancel_btn.pack(side=tk.LEFT)
 
         # Adjust window size for all widgets
-        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT_VIDEO}")
+        self.root.geometry(_GEOMETRY)
 
     def on_quality_change(self, event: Any = None) -> None:
         """Save quality preference when changed.
@@ -175,7 +205,7 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
         Args:
             event: Tkinter event object (unused but required by event binding).
         """
-        quality = self.quality_var.get()
+        quality = self.quality_combo.get()
         self.user_config.set_video_quality(quality)
 
     def save_directory_preference(self, directory: str) -> None:
@@ -202,14 +232,13 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
         Raises:
             ValueError: If format is invalid or not allowed
         """
+        # Every allowed format is lowercase alphanumeric, so membership alone
+        # rules out injected characters
         fmt = fmt.strip().lower()
         if fmt not in ALLOWED_VIDEO_FORMATS:
-            logger.warning(f"Invalid video format requested: {fmt}")
+            logger.warning("Invalid video format requested: %s", fmt)
             raise ValueError(f"Unsupported video format. Allowed formats: {', '.join(ALLOWED_VIDEO_FORMATS)}")
-        if not re.match(r'^[a-z0-9]+$', fmt):
-            logger.warning(f"Video format contains invalid characters: {fmt}")
-            raise ValueError("Invalid format string")
-        logger.info(f"Video format validated: {fmt}")
+        logger.info("Video format validated: %s", fmt)
         return fmt
 
     def _validate_concurrent_fragments(self, count: int) -> int:
@@ -226,9 +255,9 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
             ValueError: If count is invalid
         """
         if count < 1 or count > MAX_CONCURRENT_FRAGMENTS:
-            logger.warning(f"Invalid concurrent fragment count: {count}")
+            logger.warning("Invalid concurrent fragment count: %s", count)
             raise ValueError(f"Concurrent fragments must be between 1 and {MAX_CONCURRENT_FRAGMENTS}")
-        logger.info(f"Concurrent fragments validated: {count}")
+        logger.info("Concurrent fragments validated: %s", count)
         return count
 
     def _sanitize_postprocessor_args(self, args: List[str]) -> List[str]:
@@ -241,15 +270,13 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
         Returns:
             Sanitized argument list
         """
-        allowed_args = {'-c:v', '-c:a', 'copy', '-preset', 'fast', 'medium', 'slow',
-                       '-crf', '18', '20', '22', '23', '24', '-b:v', '-b:a', '-vf', '-af'}
-        sanitized_args = []
-        for arg in args:
-            if arg in allowed_args or re.match(r'^\d+[kKmM]?$', arg):
-                sanitized_args.append(arg)
-            else:
-                logger.warning(f"Removing potentially dangerous postprocessor arg: {arg}")
-        logger.info(f"Postprocessor args sanitized: {len(args)} -> {len(sanitized_args)}")
+        # Set lookup first; the regex only runs for args outside the allowlist
+        is_numeric = _NUMERIC_ARG_RE.match
+        sanitized_args = [arg for arg in args if arg in ALLOWED_POSTPROCESSOR_ARGS or is_numeric(arg)]
+        if len(sanitized_args) != len(args):
+            removed = [arg for arg in args if arg not in sanitized_args]
+            logger.warning("Removing potentially dangerous postprocessor args: %s", removed)
+        logger.info("Postprocessor args sanitized: %d -> %d", len(args), len(sanitized_args))
         return sanitized_args
 
     def _sanitize_download_options(self, ydl_opts: Dict[str, Any]) -> Dict[str, Any]:
@@ -275,7 +302,7 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
         dangerous_opts = ['exec', 'external_downloader_args']
         for opt in dangerous_opts:
             if opt in ydl_opts:
-                logger.warning(f"Removing dangerous option: {opt}")
+                logger.warning("Removing dangerous option: %s", opt)
                 del ydl_opts[opt]
         return ydl_opts
 
@@ -294,32 +321,44 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
         if d['status'] == 'downloading':
             try:
                 # Calculate progress percentage
-                total_bytes: int = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
+                total_bytes: int = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
                 downloaded: int = d.get('downloaded_bytes', 0)
                 if total_bytes:
                     progress: float = (downloaded / total_bytes) * 100
                     speed: int = d.get('speed', 0)
                     if speed:
-                        speed_mb: float = speed / 1024 / 1024  # Convert to MB/s
+                        speed_mb: float = speed * _INV_MIB  # Convert to MB/s
                         eta: int = d.get('eta', 0)
-                        status_text: str = f'Downloading: {progress:.1f}% (Speed: {speed_mb:.1f} MB/s, ETA: {eta}s)'
+                        status_text = _STATUS_FMT(progress, speed_mb, eta)
                     else:
-                        status_text: str = f'Downloading: {progress:.1f}%'
-
-                    # Update progress bar in main thread
-                    self.root.after(0, lambda: self.update_progress(progress, status_text))
-            except Exception as e:
-                logging.error(f"Error updating progress: {str(e)}")
+                        status_text = _PROGRESS_FMT(progress)
+
+                    # Overwrite the pending update; queue a UI callback only if
+                    # none is waiting, so bursts collapse into one redraw
+                    with self._progress_lock:
+                        schedule = self._pending_progress is None
+                        self._pending_progress = (progress, status_text)
+                    if schedule:
+                        self._post_ui(self._apply_pending_progress)
+            except Exception:
+                logger.error("Error updating progress", exc_info=True)
         elif d['status'] == 'finished':
-            logging.info("Download completed!")
-            self.root.after(0, lambda: self.update_progress(100, "Download complete!"))
+            logger.info("Download completed!")
+            self._post_ui(self.update_progress, 100, "Download complete!")
+
+    def _apply_pending_progress(self) -> None:
+        """Draw the most recent progress posted by download_hook."""
+        with self._progress_lock:
+            pending, self._pending_progress = self._pending_progress, None
+        if pending is not None:
+            self.update_progress(*pending)
 
     def update_progress(self, progress: float, status_text: str) -> None:
         """Update the progress bar and status label.
 
-        Safely updates UI elements from the download worker thread by
-        using the main thread. Forces UI refresh to ensure smooth
-        progress display.
+        Runs on the main thread (queued from the download worker via
+        _post_ui). Tk repaints on its next idle cycle, so no forced
+        refresh is done here.
 
         Args:
             progress: Progress percentage (0-100).
@@ -327,13 +366,12 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
         """
         self.progress_var.set(progress)
         self.status_label.config(text=status_text)
-        self.root.update_idletasks()
 
     def download(self) -> None:
         """Start the video download process with security validations.
 
-        Initiates video download in a background thread with the selected
-        quality settings. Applies comprehensive security validations including:
+        Queues the video download on the shared background event loop with
+        the selected quality settings. Applies comprehensive security validations including:
         - URL sanitization and validation
         - Download option sanitization
         - Input length limits
@@ -346,8 +384,8 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
         - Progress hooks for UI updates
 
         Disables the download button and enables the cancel button while
-        downloading. All download work happens in a daemon thread to
-        prevent blocking the UI.
+        downloading. yt-dlp runs in the loop's worker thread and progress
+        updates are batched back to Tk, so the UI never blocks.
         """
         try:
             # Security: Get and strip URL (further validation in worker)
@@ -364,47 +402,49 @@ class YouTubeVideoDownloaderGUI(BaseYouTubeDownloaderGUI):
             self.cancel_btn.config(state='normal')
 
             # Get selected quality
-            selected_quality = self.quality_var.get()
-            quality_format = VIDEO_QUALITIES.get(selected_quality, VIDEO_QUALITIES[DEFAULT_VIDEO_QUALITY])
-
-            # Build download options
-            ydl_opts: dict[str, Any] = {
-                'format': quality_format,
-                'progress_hooks': [self.download_hook],
-                'noplaylist': True,
-                'merge_output_format': 'mp4',
-                'concurrent_fragment_downloads': CONCURRENT_FRAGMENTS,
-                'postprocessor_args': ['-c:v', 'copy', '-c:a', 'copy'],
-            }
-
-            # Security: Sanitize download options to prevent command injection
-            ydl_opts = self._sanitize_download_options(ydl_opts)
+            selected_quality = self.quality_combo.get()
+
+            cached_opts = self._opts_cache.get(selected_quality)
+            if cached_opts is None:
+                quality_format = VIDEO_QUALITIES.get(sys.intern(selected_quality), VIDEO_QUALITIES[DEFAULT_VIDEO_QUALITY])
+
+                # Build download options
+                ydl_opts: dict[str, Any] = {
+                    'format': quality_format,
+                    'noplaylist': True,
+                    'merge_output_format': 'mp4',
+                    'concurrent_fragment_downloads': CONCURRENT_FRAGMENTS,
+                    'postprocessor_args': ['-c:v', 'copy', '-c:a', 'copy', *_ffmpeg_thread_args()],
+                }
+
+                # Security: Sanitize download options to prevent command injection
+                ydl_opts = self._sanitize_download_options(ydl_opts)
+                self._opts_cache[selected_quality] = copy.deepcopy(ydl_opts)
+            else:
+                ydl_opts = copy.deepcopy(cached_opts)
+
+            ydl_opts['progress_hooks'] = [self.download_hook]
 
             # Security logging: Log download initiation (without full URL to avoid log injection)
-            url_domain = url.split('/')[2] if len(url.split('/')) > 2 else 'unknown'
-            logger.info(f"Starting video download - Quality: {selected_quality}, Domain: {url_domain}")
-            logging.info(f"Video download initiated - Quality: {selected_quality}")
-
-            # Start download thread
-            self.download_thread = threading.Thread(
-                target=self.download_worker,
-                args=(url, ydl_opts),
-                daemon=True
-            )
-            self.download_thread.start()
+            # The parse is cached, so worker-side validation reuses it
+            url_domain = _cached_urlparse(url).netloc or 'unknown'
+            logger.info("Starting video download - Quality: %s, Domain: %s", selected_quality, url_domain)
+
+            # Hand off to the persistent download worker
+            self._start_download(url, ydl_opts)
 
         except ValueError as e:
             # Show validation errors to user
             messagebox.showerror("Validation Error", str(e))
             self.download_btn.config(state='normal')
             self.cancel_btn.config(state='disabled')
-            logger.warning(f"Download validation failed: {e}")
+            logger.warning("Download validation failed: %s", e)
         except Exception as e:
             # Catch any unexpected errors
             messagebox.showerror("Error", "An unexpected error occurred. Please try again.")
             self.download_btn.config(state='normal')
             self.cancel_btn.config(state='disabled')
-            logger.error(f"Unexpected error in download initiation: {e}", exc_info=True)
+            logger.error("Unexpected error in download initiation: %s", e, exc_info=True)
 
 
 def main() -> None:
@@ -414,6 +454,7 @@ def main() -> None:
     GUI, and starts the main event loop. This function is called when
     the module is run directly or via the yt-video console script.
     """
+    configure_logging()
     root: tk.Tk = tk.Tk()
     app: YouTubeVideoDownloaderGUI = YouTubeVideoDownloaderGUI(root)
     root.mainloop()